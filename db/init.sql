@@ -52,7 +52,8 @@ CREATE TABLE app_user
   created_on      TIMESTAMP DEFAULT timezone('utc' :: TEXT, now()) NOT NULL,
   current_login   TIMESTAMP,
   last_login      TIMESTAMP,
-  login_count     INTEGER DEFAULT 0
+  login_count     INTEGER DEFAULT 0,
+  token_version   INTEGER DEFAULT 0                                NOT NULL
 );
 
 CREATE TABLE department
@@ -592,6 +593,9 @@ CREATE INDEX passport_employee_id_index
 CREATE INDEX payment_employee_id_index
   ON public.payment (employee_id);
 
+CREATE INDEX payment_employee_id_payment_date_index
+  ON public.payment (employee_id, payment_date);
+
 CREATE INDEX payment_detail_payment_id_index
   ON public.payment_detail (payment_id);
 
@@ -637,6 +641,183 @@ CREATE UNIQUE INDEX uniform_requirement_employee_id_uniform_item_id_uindex
 CREATE UNIQUE INDEX uniform_size_size_description_uniform_item_id_uindex
   ON uniform_size (size_description, uniform_item_id);
 
+-- The versions are counted by table and organization, so a write only
+-- waits for the writes to the same table of the same organization that
+-- have not committed yet.  Transactions of one organization that write
+-- two tables in opposite order can still deadlock, in which case
+-- PostgreSQL aborts one of them.  Tables shared by all organizations use
+-- the organization 0.
+CREATE TABLE table_version
+(
+  table_name      VARCHAR(63)       NOT NULL,
+  organization_id INTEGER DEFAULT 0 NOT NULL,
+  version         BIGINT DEFAULT 0  NOT NULL,
+  CONSTRAINT table_version_pkey
+    PRIMARY KEY (table_name, organization_id)
+);
+
+-- The argument of the trigger is a query returning the organization of
+-- each row of the transition table given as %s.  Shared tables have no
+-- argument.
+CREATE FUNCTION increment_table_version() RETURNS TRIGGER AS $$
+DECLARE
+  changed TEXT;
+BEGIN
+  IF TG_OP = 'TRUNCATE' OR TG_NARGS = 0 THEN
+    changed := 'SELECT 0';
+  ELSIF TG_OP = 'INSERT' THEN
+    changed := format(TG_ARGV[0], 'new_rows');
+  ELSIF TG_OP = 'DELETE' THEN
+    changed := format(TG_ARGV[0], 'old_rows');
+  ELSE
+    -- A row moved to another organization changes both of them.
+    changed := format(TG_ARGV[0], 'new_rows') || ' UNION ' ||
+               format(TG_ARGV[0], 'old_rows');
+  END IF;
+
+  -- The rows are locked in the order of the organizations, so two
+  -- statements on the same table can not deadlock each other.
+  EXECUTE format('INSERT INTO table_version
+                    (table_name, organization_id, version)
+                  SELECT DISTINCT %L, organization_id, 1
+                  FROM (%s) AS changed (organization_id)
+                  ORDER BY organization_id
+                  ON CONFLICT (table_name, organization_id)
+                  DO UPDATE SET version = table_version.version + 1',
+                 TG_TABLE_NAME, changed);
+
+  IF TG_OP = 'TRUNCATE' THEN
+    UPDATE table_version SET version = version + 1
+    WHERE table_name = TG_TABLE_NAME AND organization_id <> 0;
+  END IF;
+
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE FUNCTION increment_token_version() RETURNS TRIGGER AS $$
+BEGIN
+  IF NEW.is_active IS DISTINCT FROM OLD.is_active
+     OR NEW.is_super IS DISTINCT FROM OLD.is_super
+     OR NEW.organization_id IS DISTINCT FROM OLD.organization_id
+     OR NEW.password_hash IS DISTINCT FROM OLD.password_hash THEN
+    NEW.token_version := OLD.token_version + 1;
+  END IF;
+
+  RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER app_user_token_version_trigger
+  BEFORE UPDATE ON app_user
+  FOR EACH ROW
+  EXECUTE PROCEDURE increment_token_version();
+
+-- The tokens of the users of an organization are also revoked when the
+-- organization is inactivated or activated again.
+CREATE FUNCTION increment_organization_token_version() RETURNS TRIGGER AS $$
+BEGIN
+  UPDATE app_user SET token_version = token_version + 1
+  WHERE organization_id = NEW.id;
+
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE TRIGGER organization_token_version_trigger
+  AFTER UPDATE ON organization
+  FOR EACH ROW
+  WHEN (NEW.is_active IS DISTINCT FROM OLD.is_active)
+  EXECUTE PROCEDURE increment_organization_token_version();
+
+DO $$
+DECLARE
+  t RECORD;
+BEGIN
+  FOR t IN SELECT * FROM (VALUES
+    ('organization', 'SELECT id FROM %s'),
+    ('app_user', 'SELECT organization_id FROM %s'),
+    ('creditor', 'SELECT organization_id FROM %s'),
+    ('department', 'SELECT organization_id FROM %s'),
+    ('employment_position', 'SELECT organization_id FROM %s'),
+    ('shift', 'SELECT organization_id FROM %s'),
+    ('uniform_item', 'SELECT organization_id FROM %s'),
+    ('employee', 'SELECT d.organization_id FROM %s r
+                  JOIN department d ON d.id = r.department_id'),
+    ('schedule', 'SELECT d.organization_id FROM %s r
+                  JOIN department d ON d.id = r.department_id'),
+    ('uniform_size', 'SELECT i.organization_id FROM %s r
+                      JOIN uniform_item i ON i.id = r.uniform_item_id'),
+    ('schedule_detail', 'SELECT d.organization_id FROM %s r
+                         JOIN schedule s ON s.id = r.schedule_id
+                         JOIN department d ON d.id = s.department_id'),
+    ('raw_attendance', 'SELECT d.organization_id FROM %s r
+                        JOIN employee e ON e.id = r.userid
+                        JOIN department d ON d.id = e.department_id'),
+    ('payment_detail', 'SELECT d.organization_id FROM %s r
+                        JOIN payment p ON p.id = r.payment_id
+                        JOIN employee e ON e.id = p.employee_id
+                        JOIN department d ON d.id = e.department_id'),
+    ('deduction_detail', 'SELECT d.organization_id FROM %s r
+                          JOIN deduction x ON x.id = r.deduction_id
+                          JOIN employee e ON e.id = x.employee_id
+                          JOIN department d ON d.id = e.department_id')
+  ) AS scope (table_name, organization_query)
+  UNION ALL
+  SELECT table_name, 'SELECT d.organization_id FROM %s r
+                      JOIN employee e ON e.id = r.employee_id
+                      JOIN department d ON d.id = e.department_id'
+  FROM unnest(ARRAY['absence_authorization', 'attendance', 'bank_account',
+                    'deduction', 'dependent', 'emergency_contact',
+                    'health_permit', 'passport', 'payment', 'sick_note',
+                    'uniform_requirement']) AS table_name
+  LOOP
+    -- Transition tables can only be declared by triggers of one event.
+    EXECUTE format('CREATE TRIGGER %I
+                    AFTER INSERT ON %I
+                    REFERENCING NEW TABLE AS new_rows
+                    FOR EACH STATEMENT
+                    EXECUTE PROCEDURE increment_table_version(%L)',
+                   t.table_name || '_insert_version_trigger',
+                   t.table_name, t.organization_query);
+    EXECUTE format('CREATE TRIGGER %I
+                    AFTER UPDATE ON %I
+                    REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+                    FOR EACH STATEMENT
+                    EXECUTE PROCEDURE increment_table_version(%L)',
+                   t.table_name || '_update_version_trigger',
+                   t.table_name, t.organization_query);
+    EXECUTE format('CREATE TRIGGER %I
+                    AFTER DELETE ON %I
+                    REFERENCING OLD TABLE AS old_rows
+                    FOR EACH STATEMENT
+                    EXECUTE PROCEDURE increment_table_version(%L)',
+                   t.table_name || '_delete_version_trigger',
+                   t.table_name, t.organization_query);
+    EXECUTE format('CREATE TRIGGER %I
+                    AFTER TRUNCATE ON %I
+                    FOR EACH STATEMENT
+                    EXECUTE PROCEDURE increment_table_version()',
+                   t.table_name || '_truncate_version_trigger',
+                   t.table_name);
+  END LOOP;
+
+  -- The remaining tables are shared by all organizations.
+  FOR t IN SELECT tablename AS table_name FROM pg_tables
+           WHERE schemaname = 'public' AND tablename <> 'table_version'
+             AND NOT EXISTS (SELECT FROM pg_trigger
+                             WHERE tgrelid = tablename::regclass
+                               AND tgname LIKE '%version_trigger')
+  LOOP
+    EXECUTE format('CREATE TRIGGER %I
+                    AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON %I
+                    FOR EACH STATEMENT
+                    EXECUTE PROCEDURE increment_table_version()',
+                   t.table_name || '_version_trigger', t.table_name);
+  END LOOP;
+END;
+$$;
+
 INSERT INTO organization (organization_name, is_active) VALUES
   ('Nuvanz', TRUE);
 
@@ -0,0 +1,44 @@
+-- Adds the token versions, which revoke the tokens of a user when it is
+-- inactivated or its organization, permissions or password change.  Every
+-- statement can be run again.
+
+ALTER TABLE app_user
+  ADD COLUMN IF NOT EXISTS token_version INTEGER DEFAULT 0 NOT NULL;
+
+CREATE OR REPLACE FUNCTION increment_token_version() RETURNS TRIGGER AS $$
+BEGIN
+  IF NEW.is_active IS DISTINCT FROM OLD.is_active
+     OR NEW.is_super IS DISTINCT FROM OLD.is_super
+     OR NEW.organization_id IS DISTINCT FROM OLD.organization_id
+     OR NEW.password_hash IS DISTINCT FROM OLD.password_hash THEN
+    NEW.token_version := OLD.token_version + 1;
+  END IF;
+
+  RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS app_user_token_version_trigger ON app_user;
+CREATE TRIGGER app_user_token_version_trigger
+  BEFORE UPDATE ON app_user
+  FOR EACH ROW
+  EXECUTE PROCEDURE increment_token_version();
+
+-- The tokens of the users of an organization are also revoked when the
+-- organization is inactivated or activated again.
+CREATE OR REPLACE FUNCTION increment_organization_token_version()
+  RETURNS TRIGGER AS $$
+BEGIN
+  UPDATE app_user SET token_version = token_version + 1
+  WHERE organization_id = NEW.id;
+
+  RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS organization_token_version_trigger ON organization;
+CREATE TRIGGER organization_token_version_trigger
+  AFTER UPDATE ON organization
+  FOR EACH ROW
+  WHEN (NEW.is_active IS DISTINCT FROM OLD.is_active)
+  EXECUTE PROCEDURE increment_organization_token_version();
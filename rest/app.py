@@ -2,17 +2,22 @@ from flask import Flask
 from flask_jwt import JWT
 from flask_restful import Api
 
+from compression import compress_response
 from config import config
+from representations import add_vary, REPRESENTATIONS
 from resources.absence_authorization import AbsenceAuthorization, \
     AbsenceAuthorizations
-from resources.attendance import Attendance, Attendances
+from resources.attendance import Attendance, Attendances, \
+    ExportAttendances
 from resources.bank import Banks
 from resources.bank_account import ActivateBankAccount, BankAccount, \
     BankAccounts
 from resources.country import Countries
 from resources.creditor import ActivateCreditor, Creditor, Creditors
-from resources.deduction import ActivateDeduction, Deduction, Deductions
-from resources.deduction_detail import DeductionDetail, DeductionDetails
+from resources.deduction import ActivateDeduction, Deduction, Deductions, \
+    ExportDeductions
+from resources.deduction_detail import DeductionDetail, DeductionDetails, \
+    ExportDeductionDetails
 from resources.department import ActivateDepartment, Department, Departments
 from resources.dependent import Dependent, Dependents
 from resources.emergency_contact import EmergencyContact, EmergencyContacts
@@ -25,8 +30,9 @@ from resources.marital_status import MaritalStatuses
 from resources.organization import ActivateOrganization, Organization, \
     Organizations
 from resources.passport import Passport, Passports
-from resources.payment import Payment, Payments
-from resources.payment_detail import PaymentDetail, PaymentDetails
+from resources.payment import ExportPayments, Payment, Payments
+from resources.payment_detail import ExportPaymentDetails, PaymentDetail, \
+    PaymentDetails
 from resources.raw_attendance import RawAttendance, RawAttendances
 from resources.schedule import Schedule, Schedules
 from resources.schedule_detail import ScheduleDetail, ScheduleDetails
@@ -37,7 +43,7 @@ from resources.uniform_requirement import UniformRequirement, \
     UniformRequirements
 from resources.uniform_size import UniformSize, UniformSizes
 from resources.user import ActivateUser, User, Users
-from security import authenticate, identity
+from security import authenticate, identity, payload_handler
 
 
 # noinspection PyTypeChecker
@@ -54,14 +60,19 @@ def create_app(config_name):
     config[config_name].init_app(app)
 
     # Register the extensions.
-    JWT(app, authenticate, identity)
+    jwt = JWT(app, authenticate, identity)
+    jwt.jwt_payload_handler(payload_handler)
     api = Api(app)
+    api.representations.update(REPRESENTATIONS)
+    app.after_request(add_vary)
+    app.after_request(compress_response)
 
     # Add API resources.
     api.add_resource(Organization,
                      '/organization',
                      '/organization/<int:_id>')
     api.add_resource(ActivateOrganization,
+                     '/activate_organization',
                      '/activate_organization/<int:_id>')
     api.add_resource(Organizations,
                      '/organizations')
@@ -70,6 +81,7 @@ def create_app(config_name):
                      '/user',
                      '/user/<int:_id>')
     api.add_resource(ActivateUser,
+                     '/activate_user',
                      '/activate_user/<int:_id>')
     api.add_resource(Users,
                      '/users')
@@ -78,6 +90,7 @@ def create_app(config_name):
                      '/department',
                      '/department/<int:_id>')
     api.add_resource(ActivateDepartment,
+                     '/activate_department',
                      '/activate_department/<int:_id>')
     api.add_resource(Departments,
                      '/departments')
@@ -89,6 +102,7 @@ def create_app(config_name):
                      '/employment_position',
                      '/employment_position/<int:_id>')
     api.add_resource(ActivateEmploymentPosition,
+                     '/activate_employment_position',
                      '/activate_employment_position/<int:_id>')
     api.add_resource(EmploymentPositions,
                      '/employment_positions')
@@ -97,6 +111,7 @@ def create_app(config_name):
                      '/shift',
                      '/shift/<int:_id>')
     api.add_resource(ActivateShift,
+                     '/activate_shift',
                      '/activate_shift/<int:_id>')
     api.add_resource(Shifts,
                      '/shifts')
@@ -105,6 +120,7 @@ def create_app(config_name):
                      '/employee',
                      '/employee/<int:_id>')
     api.add_resource(ActivateEmployee,
+                     '/activate_employee',
                      '/activate_employee/<int:_id>')
     api.add_resource(Employees,
                      '/employees')
@@ -155,6 +171,7 @@ def create_app(config_name):
                      '/bank_account',
                      '/bank_account/<int:_id>')
     api.add_resource(ActivateBankAccount,
+                     '/activate_bank_account',
                      '/activate_bank_account/<int:_id>')
     api.add_resource(BankAccounts,
                      '/bank_accounts/<int:_id>')
@@ -185,17 +202,22 @@ def create_app(config_name):
                      '/payment/<int:_id>')
     api.add_resource(Payments,
                      '/payments/<int:_id>')
+    api.add_resource(ExportPayments,
+                     '/export_payments')
 
     api.add_resource(PaymentDetail,
                      '/payment_detail',
                      '/payment_detail/<int:_id>')
     api.add_resource(PaymentDetails,
                      '/payment_details/<int:_id>')
+    api.add_resource(ExportPaymentDetails,
+                     '/export_payment_details')
 
     api.add_resource(Creditor,
                      '/creditor',
                      '/creditor/<int:_id>')
     api.add_resource(ActivateCreditor,
+                     '/activate_creditor',
                      '/activate_creditor/<int:_id>')
     api.add_resource(Creditors,
                      '/creditors')
@@ -204,21 +226,28 @@ def create_app(config_name):
                      '/deduction',
                      '/deduction/<int:_id>')
     api.add_resource(ActivateDeduction,
+                     '/activate_deduction',
                      '/activate_deduction/<int:_id>')
     api.add_resource(Deductions,
                      '/deductions/<int:_id>')
+    api.add_resource(ExportDeductions,
+                     '/export_deductions')
 
     api.add_resource(DeductionDetail,
                      '/deduction_detail',
                      '/deduction_detail/<int:_id>')
     api.add_resource(DeductionDetails,
                      '/deduction_details/<int:_id>')
+    api.add_resource(ExportDeductionDetails,
+                     '/export_deduction_details')
 
     api.add_resource(Attendance,
                      '/attendance',
                      '/attendance/<int:_id>')
     api.add_resource(Attendances,
                      '/attendances/<int:_id>')
+    api.add_resource(ExportAttendances,
+                     '/export_attendances')
 
     api.add_resource(RawAttendance,
                      '/raw_attendance')
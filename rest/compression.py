@@ -0,0 +1,77 @@
+import zlib
+
+from flask import current_app, request
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+
+def compress_response(response):
+    """
+    Compress the response with the best encoding accepted by the client.
+
+    Streamed responses are compressed chunk by chunk as they are sent,
+    other responses only when they reach COMPRESS_MIN_SIZE bytes.
+
+    :param response: The response of the request
+    :return: The compressed response
+    """
+    if response.status_code < 200 or response.status_code in (204, 304) \
+            or response.direct_passthrough \
+            or 'Content-Encoding' in response.headers:
+        return response
+
+    response.vary.add('Accept-Encoding')
+    encoding = request.accept_encodings.best_match(
+        ('br', 'gzip') if brotli else ('gzip',))
+
+    if encoding is None:
+        return response
+
+    if response.is_streamed:
+        compress, flush, finish = get_compressor(encoding)
+        response.response = compress_stream(response.iter_encoded(),
+                                            compress, flush, finish)
+        response.headers.pop('Content-Length', None)
+    else:
+        data = response.get_data()
+
+        if len(data) < current_app.config['COMPRESS_MIN_SIZE']:
+            return response
+
+        compress, _, finish = get_compressor(encoding)
+        response.set_data(compress(data) + finish())
+
+    response.headers['Content-Encoding'] = encoding
+
+    return response
+
+
+def compress_stream(chunks, compress, flush, finish):
+    # Each chunk is flushed, otherwise the compressor would keep it until
+    # its buffer fills and the client would not receive the first
+    # records as soon as they are read.
+    for chunk in chunks:
+        data = compress(chunk) + flush()
+
+        if data:
+            yield data
+
+    yield finish()
+
+
+def get_compressor(encoding):
+    config = current_app.config
+
+    if encoding == 'br':
+        compressor = brotli.Compressor(quality=config['COMPRESS_BR_LEVEL'])
+
+        return compressor.process, compressor.flush, compressor.finish
+
+    compressor = zlib.compressobj(config['COMPRESS_LEVEL'], zlib.DEFLATED,
+                                  31)
+
+    return compressor.compress, \
+        lambda: compressor.flush(zlib.Z_SYNC_FLUSH), compressor.flush
@@ -17,6 +17,20 @@ class Config:
     TESTING = os.environ.get('TESTING') or False
     DEBUG = os.environ.get('DEBUG') or True
     JWT_EXPIRATION_DELTA = timedelta(seconds=1800)
+    COMPRESS_MIN_SIZE = int(os.environ.get('COMPRESS_MIN_SIZE') or 500)
+    COMPRESS_LEVEL = 6
+    COMPRESS_BR_LEVEL = 4
+    DB_JSON_AGGREGATION = os.environ.get(
+        'DB_JSON_AGGREGATION', '').lower() in ('1', 'true')
+    # orjson writes compact JSON without escaping non-ASCII characters,
+    # so it is only used when enabled.
+    ORJSON = os.environ.get('ORJSON', '').lower() in ('1', 'true')
+    # Each worker caches the token versions of the users.  A change to a
+    # user only drops the cached version in the worker that served it, so
+    # the other workers may accept the tokens revoked by the change for up
+    # to IDENTITY_CACHE_TTL seconds.
+    IDENTITY_CACHE_TTL = int(os.environ.get('IDENTITY_CACHE_TTL') or 5)
+    IDENTITY_CACHE_SIZE = int(os.environ.get('IDENTITY_CACHE_SIZE') or 1000)
 
     @staticmethod
     def init_app(app):
@@ -10,6 +10,8 @@ class AbsenceAuthorizationModel(ModelMixin, db.Model):
                                        name='absence_authorization_employee_id'
                                             '_absence_date_uindex'),)
     exclude_from_update = ('employee_id',)
+    scope_path = ('employee', 'department')
+    parent_key = 'employee_id'
 
     id = db.Column(db.Integer, primary_key=True)
     absence_date = db.Column(db.Date, nullable=False)
@@ -28,22 +30,3 @@ class AbsenceAuthorizationModel(ModelMixin, db.Model):
         self.is_payment_authorized = is_payment_authorized
         self.authorization_request_date = authorization_request_date
         self.employee_id = employee_id
-
-    @classmethod
-    def find_by_id(cls, _id, user):
-        from models.employee import EmployeeModel
-
-        record = cls.query.filter_by(id=_id).first()
-
-        if record:
-            if EmployeeModel.find_by_id(record.employee_id, user):
-                return record
-
-    @classmethod
-    def find_all(cls, user, employee_id):
-        from models.employee import EmployeeModel
-
-        records = cls.query.filter_by(employee_id=employee_id).all()
-
-        if records and EmployeeModel.find_by_id(employee_id, user):
-            return records
@@ -10,6 +10,8 @@ class AttendanceModel(ModelMixin, db.Model):
                                        name='attendance_employee_id_'
                                             'work_day_uindex'),)
     exclude_from_update = ('employee_id',)
+    scope_path = ('employee', 'department')
+    parent_key = 'employee_id'
 
     id = db.Column(db.Integer, primary_key=True)
     work_day = db.Column(db.Date, nullable=False)
@@ -29,22 +31,3 @@ class AttendanceModel(ModelMixin, db.Model):
         self.break_end = break_end
         self.day_end = day_end
         self.employee_id = employee_id
-
-    @classmethod
-    def find_by_id(cls, _id, user):
-        from models.employee import EmployeeModel
-
-        record = cls.query.filter_by(id=_id).first()
-
-        if record:
-            if EmployeeModel.find_by_id(record.employee_id, user):
-                return record
-
-    @classmethod
-    def find_all(cls, user, employee_id):
-        from models.employee import EmployeeModel
-
-        records = cls.query.filter_by(employee_id=employee_id).all()
-
-        if records and EmployeeModel.find_by_id(employee_id, user):
-            return records
@@ -12,6 +12,8 @@ class BankAccountModel(ModelMixin, db.Model):
                                        name='bank_account_account_number_'
                                             'employee_id_bank_id_uindex'),)
     exclude_from_update = ('employee_id',)
+    scope_path = ('employee', 'department')
+    parent_key = 'employee_id'
 
     id = db.Column(db.Integer, primary_key=True)
     account_number = db.Column(db.String(50), nullable=False)
@@ -31,22 +33,3 @@ class BankAccountModel(ModelMixin, db.Model):
         self.is_active = is_active
         self.employee_id = employee_id
         self.bank_id = bank_id
-
-    @classmethod
-    def find_by_id(cls, _id, user):
-        from models.employee import EmployeeModel
-
-        record = cls.query.filter_by(id=_id).first()
-
-        if record:
-            if EmployeeModel.find_by_id(record.employee_id, user):
-                return record
-
-    @classmethod
-    def find_all(cls, user, employee_id):
-        from models.employee import EmployeeModel
-
-        records = cls.query.filter_by(employee_id=employee_id).all()
-
-        if records and EmployeeModel.find_by_id(employee_id, user):
-            return records
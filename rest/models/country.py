@@ -6,6 +6,7 @@ from models.passport import PassportModel
 class CountryModel(ModelMixin, db.Model):
     __tablename__ = 'country'
     exclude_from_update = None
+    sort_key = 'country_name'
 
     id = db.Column(db.Integer, primary_key=True)
     country_name = db.Column(db.String(80), nullable=False)
@@ -13,12 +14,8 @@ class CountryModel(ModelMixin, db.Model):
 
     passports = db.relationship(PassportModel,
                                 backref='country',
-                                lazy='joined')
+                                lazy='select')
 
     def __init__(self, country_name, nationality):
         self.country_name = country_name
         self.nationality = nationality
-
-    @classmethod
-    def find_all(cls, _):
-        return cls.query.order_by('country_name').all()
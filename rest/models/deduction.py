@@ -7,6 +7,8 @@ from models.mixin import ModelMixin
 class DeductionModel(ModelMixin, db.Model):
     __tablename__ = 'deduction'
     exclude_from_update = ('employee_id', 'is_active')
+    scope_path = ('employee', 'department')
+    parent_key = 'employee_id'
 
     id = db.Column(db.Integer, primary_key=True)
     start_date = db.Column(db.Date, nullable=False)
@@ -37,22 +39,3 @@ class DeductionModel(ModelMixin, db.Model):
         self.is_active = is_active
         self.employee_id = employee_id
         self.creditor_id = creditor_id
-
-    @classmethod
-    def find_by_id(cls, _id, user):
-        from models.employee import EmployeeModel
-
-        record = cls.query.filter_by(id=_id).first()
-
-        if record:
-            if EmployeeModel.find_by_id(record.employee_id, user):
-                return record
-
-    @classmethod
-    def find_all(cls, user, employee_id):
-        from models.employee import EmployeeModel
-
-        records = cls.query.filter_by(employee_id=employee_id).all()
-
-        if records and EmployeeModel.find_by_id(employee_id, user):
-            return records
@@ -6,6 +6,8 @@ from models.mixin import ModelMixin
 class DependentModel(ModelMixin, db.Model):
     __tablename__ = 'dependent'
     exclude_from_update = ('employee_id',)
+    scope_path = ('employee', 'department')
+    parent_key = 'employee_id'
 
     id = db.Column(db.Integer, primary_key=True)
     first_name = db.Column(db.String(40), nullable=False)
@@ -31,22 +33,3 @@ class DependentModel(ModelMixin, db.Model):
         self.date_of_birth = date_of_birth
         self.employee_id = employee_id
         self.family_relation_id = family_relation_id
-
-    @classmethod
-    def find_by_id(cls, _id, user):
-        from models.employee import EmployeeModel
-
-        record = cls.query.filter_by(id=_id).first()
-
-        if record:
-            if EmployeeModel.find_by_id(record.employee_id, user):
-                return record
-
-    @classmethod
-    def find_all(cls, user, employee_id):
-        from models.employee import EmployeeModel
-
-        records = cls.query.filter_by(employee_id=employee_id).all()
-
-        if records and EmployeeModel.find_by_id(employee_id, user):
-            return records
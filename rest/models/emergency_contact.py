@@ -5,6 +5,8 @@ from models.mixin import ModelMixin
 class EmergencyContactModel(ModelMixin, db.Model):
     __tablename__ = 'emergency_contact'
     exclude_from_update = ('employee_id',)
+    scope_path = ('employee', 'department')
+    parent_key = 'employee_id'
 
     id = db.Column(db.Integer, primary_key=True)
     first_name = db.Column(db.String(40), nullable=False)
@@ -24,22 +26,3 @@ class EmergencyContactModel(ModelMixin, db.Model):
         self.work_phone = work_phone
         self.mobile_phone = mobile_phone
         self.employee_id = employee_id
-
-    @classmethod
-    def find_by_id(cls, _id, user):
-        from models.employee import EmployeeModel
-
-        e_cont = cls.query.filter_by(id=_id).first()
-
-        if e_cont:
-            if EmployeeModel.find_by_id(e_cont.employee_id, user):
-                return e_cont
-
-    @classmethod
-    def find_all(cls, user, employee_id):
-        from models.employee import EmployeeModel
-
-        records = cls.query.filter_by(employee_id=employee_id).all()
-
-        if records and EmployeeModel.find_by_id(employee_id, user):
-            return records
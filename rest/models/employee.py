@@ -19,6 +19,8 @@ class EmployeeModel(ModelMixin, db.Model):
     __tablename__ = 'employee'
 
     exclude_from_update = ()
+    scope_path = ('department',)
+    activation_cascade = ('bank_accounts', 'deductions')
 
     id = db.Column(db.Integer, primary_key=True)
     first_name = db.Column(db.String(40), nullable=False)
@@ -57,38 +59,38 @@ class EmployeeModel(ModelMixin, db.Model):
 
     emergency_contacts = db.relationship(EmergencyContactModel,
                                          backref='employee',
-                                         lazy='joined')
+                                         lazy='select')
     health_permits = db.relationship(HealthPermitModel,
                                      backref='employee',
-                                     lazy='joined')
+                                     lazy='select')
     passports = db.relationship(PassportModel,
                                 backref='employee',
-                                lazy='joined')
+                                lazy='select')
     uniform_requirements = db.relationship(UniformRequirementModel,
                                            backref='employee',
-                                           lazy='joined')
+                                           lazy='select')
     bank_accounts = db.relationship(BankAccountModel,
                                     backref='employee',
-                                    lazy='joined')
+                                    lazy='select')
     dependents = db.relationship(DependentModel,
                                  backref='employee',
-                                 lazy='joined')
+                                 lazy='select')
     payments = db.relationship(PaymentModel,
                                backref='employee',
-                               lazy='joined')
+                               lazy='select')
 
     deductions = db.relationship(DeductionModel,
                                  backref='employee',
-                                 lazy='joined')
+                                 lazy='select')
     attendances = db.relationship(AttendanceModel,
                                   backref='employee',
-                                  lazy='joined')
+                                  lazy='select')
     sick_notes = db.relationship(SickNoteModel,
                                  backref='employee',
-                                 lazy='joined')
+                                 lazy='select')
     absence_authorizations = db.relationship(AbsenceAuthorizationModel,
                                              backref='employee',
-                                             lazy='joined')
+                                             lazy='select')
 
     def __init__(self, first_name, second_name, first_surname, second_surname,
                  national_id_number, is_panamanian, date_of_birth, gender,
@@ -124,22 +126,3 @@ class EmployeeModel(ModelMixin, db.Model):
         self.department_id = department_id
         self.position_id = position_id
         self.shift_id = shift_id
-
-    @classmethod
-    def find_by_id(cls, _id, user):
-        from models.department import DepartmentModel
-
-        record = cls.query.filter_by(id=_id).first()
-
-        if record:
-            if DepartmentModel.find_by_id(record.department_id, user):
-                return record
-
-    @classmethod
-    def find_all(cls, user):
-        from models.department import DepartmentModel
-
-        departments = DepartmentModel.find_all(user)
-        d_ids = [department.id for department in departments]
-
-        return cls.query.filter(cls.department_id.in_(d_ids)).all()
@@ -19,6 +19,7 @@ class EmploymentPositionModel(ModelMixin, db.Model):
                                             'organization_id_uindex')
                       )
     exclude_from_update = ('organization_id', 'is_active')
+    scope_path = ()
 
     id = db.Column(db.Integer, primary_key=True)
     position_name_feminine = db.Column(db.String(80), nullable=False)
@@ -31,7 +32,7 @@ class EmploymentPositionModel(ModelMixin, db.Model):
 
     employees = db.relationship(EmployeeModel,
                                 backref='employment_position',
-                                lazy='joined')
+                                lazy='select')
 
     def __init__(self, position_name_feminine, position_name_masculine,
                  minimum_hourly_wage,  is_active, organization_id):
@@ -40,17 +41,3 @@ class EmploymentPositionModel(ModelMixin, db.Model):
         self.minimum_hourly_wage = minimum_hourly_wage
         self.is_active = is_active
         self.organization_id = organization_id
-
-    @classmethod
-    def find_by_id(cls, _id, user):
-        from models.organization import OrganizationModel
-
-        record = cls.query.filter_by(id=_id).first()
-
-        if record:
-            if OrganizationModel.find_by_id(record.organization_id, user):
-                return record
-
-    @classmethod
-    def find_all(cls, user):
-        return cls.query.filter_by(organization_id=user.organization_id).all()
@@ -6,6 +6,8 @@ from models.mixin import ModelMixin
 class HealthPermitModel(ModelMixin, db.Model):
     __tablename__ = 'health_permit'
     exclude_from_update = ('employee_id',)
+    scope_path = ('employee', 'department')
+    parent_key = 'employee_id'
 
     id = db.Column(db.Integer, primary_key=True)
     health_permit_type = db.Column(HEALTH_PERMIT_TYPE, nullable=False)
@@ -21,22 +23,3 @@ class HealthPermitModel(ModelMixin, db.Model):
         self.issue_date = issue_date
         self.expiration_date = expiration_date
         self.employee_id = employee_id
-
-    @classmethod
-    def find_by_id(cls, _id, user):
-        from models.employee import EmployeeModel
-
-        record = cls.query.filter_by(id=_id).first()
-
-        if record:
-            if EmployeeModel.find_by_id(record.employee_id, user):
-                return record
-
-    @classmethod
-    def find_all(cls, user, employee_id):
-        from models.employee import EmployeeModel
-
-        records = cls.query.filter_by(employee_id=employee_id).all()
-
-        if records and EmployeeModel.find_by_id(employee_id, user):
-            return records
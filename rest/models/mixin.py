@@ -1,20 +1,86 @@
+import operator
+from collections import defaultdict
 from datetime import date, datetime, time
-from decimal import Decimal
+from decimal import Decimal, InvalidOperation
+from itertools import islice
 
-from sqlalchemy import MetaData
-from sqlalchemy.orm import collections
+from sqlalchemy import and_, case, cast, extract, func, literal, \
+    literal_column, MetaData, or_, select, Text, tuple_
+from sqlalchemy.dialects.postgresql import aggregate_order_by
+from sqlalchemy.orm import lazyload, load_only
 from sqlalchemy.sql import sqltypes
 from sqlalchemy.sql.schema import UniqueConstraint
+from sqlalchemy.sql.util import find_tables
 from werkzeug.security import generate_password_hash
 
 from db import db
 
+# Rows sent in each multi-row INSERT, which keeps the number of bind
+# parameters of the statement below the PostgreSQL limit.
+BULK_INSERT_SIZE = 1000
+
+# Records fetched at a time from the server side cursor of list queries.
+STREAM_BATCH_SIZE = 500
+
+# Operators accepted by list endpoints as a suffix of the filtered column,
+# e.g. ?work_day__gte=2019-01-01.
+FILTER_OPERATORS = {
+    'eq': operator.eq,
+    'gt': operator.gt,
+    'gte': operator.ge,
+    'lt': operator.lt,
+    'lte': operator.le
+}
+
+
+def isoformat(value):
+    # Records that were not reloaded yet may still hold the string that
+    # was received in the request.
+    return value if isinstance(value, str) else value.isoformat()
+
+
+def json_value(column):
+    # PostgreSQL writes decimals, datetimes and times differently from the
+    # JSON representation of the API, so they are formatted as strings.
+    if isinstance(column.type, sqltypes.Numeric):
+        return cast(column, Text)
+
+    if isinstance(column.type, (sqltypes.DateTime, sqltypes.Time)):
+        # isoformat only shows the microseconds when they are not zero.
+        whole = extract('microseconds', column).cast(sqltypes.BigInteger) \
+            % 1000000 == 0
+
+        if isinstance(column.type, sqltypes.Time):
+            return case([(whole, cast(column, Text))],
+                        else_=func.rpad(cast(column, Text), 15, '0'))
+
+        return case([(whole,
+                      func.to_char(column, 'YYYY-MM-DD"T"HH24:MI:SS'))],
+                    else_=func.to_char(column, 'YYYY-MM-DD"T"HH24:MI:SS.US'))
+
+    return column
+
 
 # noinspection PyAttributeOutsideInit
 class ModelMixin(object):
     metadata = MetaData()
     __table__ = None
     exclude_from_update = None
+    # Relationships that lead from the model to the model holding the
+    # organization_id of the record.  Models shared by all organizations
+    # leave it as None.
+    scope_path = None
+    # Foreign key that list endpoints filter on when they receive the id
+    # of a parent record, e.g. employee_id for the payments of an employee.
+    parent_key = None
+    # Collections of the model that are inactivated together with the
+    # records by a bulk inactivation.
+    activation_cascade = ()
+    # Column that list endpoints order by before the id.  Models without
+    # one are listed in id order.
+    sort_key = None
+    # Internal columns that are never included in the records.
+    hidden_columns = ()
     __tablename__ = None
     id = None
 
@@ -28,8 +94,29 @@ class ModelMixin(object):
         return f'<{class_name}({attributes})>'
 
     def activate(self):
-        self.is_active = True
-        self.save_to_db()
+        self.set_active([self.id], True)
+
+    @classmethod
+    def build_filter(cls, key, op, value):
+        # Values read from a JSON body are parsed as the strings of the
+        # query string, so a value of the wrong type is rejected before
+        # it reaches the database.
+        if value is not None:
+            value = cls.parse_value(key, str(value))
+
+        return FILTER_OPERATORS[op](getattr(cls, key), value)
+
+    @classmethod
+    def cascade_inactivation(cls, ids):
+        for key in cls.activation_cascade:
+            relationship = getattr(cls, key).property
+            child = relationship.mapper.class_.__table__
+            column, = relationship.remote_side
+
+            db.session.execute(child.update()
+                               .where(column.in_(ids))
+                               .where(child.c.is_active.is_(True))
+                               .values(is_active=False))
 
     def delete_from_db(self):
         if hasattr(self, 'is_active'):
@@ -41,6 +128,278 @@ class ModelMixin(object):
             db.session.delete(self)
             db.session.commit()
 
+    @classmethod
+    def export_rows(cls, user, filters=()):
+        query = cls.scoped_query(user).filter(*filters).order_by(cls.id)
+
+        return cls.select_rows(query).yield_per(STREAM_BATCH_SIZE)
+
+    @classmethod
+    def filter_by_organization(cls, query, organization_id):
+        if cls.scope_path is None:
+            return query
+
+        model = cls
+
+        for key in cls.scope_path:
+            relationship = getattr(model, key)
+            query = query.join(relationship)
+            model = relationship.property.mapper.class_
+
+        if model.__tablename__ == 'organization':
+            return query.filter(model.id == organization_id)
+
+        return query.filter(model.organization_id == organization_id)
+
+    @classmethod
+    def find_all(cls, user, parent_id=None, fields=None, filters=(),
+                 sort=None):
+        query = cls.list_query(user, parent_id, filters, sort)
+
+        return cls.select_rows(query, fields, sort)\
+            .yield_per(STREAM_BATCH_SIZE)
+
+    @classmethod
+    def find_by_id(cls, _id, user, fields=None):
+        query = cls.scoped_query(user, allow_super=True).filter(cls.id == _id)
+
+        return cls.load_fields(query, fields).first()
+
+    @classmethod
+    def find_ids(cls, user, filters):
+        query = cls.scoped_query(user).filter(*filters).with_entities(cls.id)
+
+        return [_id for _id, in query]
+
+    @classmethod
+    def find_json_by_id(cls, _id, user, fields=None, expand=(), depth=None):
+        query = cls.scoped_query(user, allow_super=True).filter(cls.id == _id)
+        record = query.with_entities(
+            *cls.get_json_columns(fields, expand, depth)).subquery('record')
+
+        # The document is read as text so it is not decoded by psycopg2.
+        return db.session.query(
+            cast(func.row_to_json(literal_column(record.name)), Text))\
+            .select_from(record).scalar()
+
+    @classmethod
+    def find_page(cls, user, limit, after=None, parent_id=None,
+                  fields=None, filters=(), sort=None):
+        query = cls.list_query(user, parent_id, filters, sort)
+
+        if after is not None:
+            columns = tuple_(*cls.get_sort_columns(sort))
+
+            if sort and sort.startswith('-'):
+                query = query.filter(columns < tuple_(*after))
+            else:
+                query = query.filter(columns > tuple_(*after))
+
+        return cls.select_rows(query, fields, sort).limit(limit).all()
+
+    @classmethod
+    def find_unique_conflict(cls, data, _id=None):
+        constraints = cls.get_unique_constraints()
+
+        if not constraints:
+            return None
+
+        conditions = [
+            and_(*[getattr(cls, key) == data[key] for key in constraint])
+            for constraint in constraints
+        ]
+
+        # A single query checks every constraint and reports which ones
+        # the conflicting record violates.
+        query = db.session.query(cls.id, *conditions)\
+            .filter(or_(*conditions))
+
+        if _id is not None:
+            query = query.filter(cls.id != _id)
+
+        row = query.first()
+
+        if row:
+            for constraint, violated in zip(constraints, row[1:]):
+                if violated:
+                    return {key: data[key] for key in constraint}
+
+        return None
+
+    @classmethod
+    def find_unique_conflicts(cls, rows):
+        conflicts = {}
+
+        for constraint in cls.get_unique_constraints():
+            indexes = {}
+
+            for index, row in enumerate(rows):
+                value = tuple(cls.normalize_value(key, row[key])
+                              for key in constraint)
+
+                # Rows repeating a value of an earlier row of the batch.
+                if value in indexes:
+                    conflicts.setdefault(
+                        index, {key: row[key] for key in constraint})
+                else:
+                    indexes[value] = index
+
+            if not indexes:
+                continue
+
+            # The database compares the values of the rows as it stores
+            # them and reports which row matched, so values written in
+            # another format, like '2019-1-1', are also found.
+            columns = tuple_(*[getattr(cls, key) for key in constraint])
+            values = {index: tuple_(*[rows[index][key]
+                                      for key in constraint])
+                      for index in indexes.values()}
+            matched = case([(columns == value, index)
+                            for index, value in values.items()])
+            query = db.session.query(matched)\
+                .filter(columns.in_(list(values.values())))
+
+            for index, in query:
+                conflicts.setdefault(
+                    index, {key: rows[index][key] for key in constraint})
+
+        return conflicts
+
+    def get_column_values(self):
+        return {col.key: getattr(self, col.key)
+                for col in self.__table__.columns if col.key in vars(self)}
+
+    @classmethod
+    def get_json_columns(cls, fields=None, expand=(), depth=None):
+        # The columns of the record followed by the collections that to_dict
+        # would include, each one aggregated in a correlated subquery.
+        columns = [json_value(column).label(column.key)
+                   for column in cls.__table__.columns
+                   if column.key not in cls.hidden_columns and
+                   (not fields or column.key == 'id' or column.key in fields)]
+
+        if fields or depth == 0:
+            return columns
+
+        depth = None if depth is None else depth - 1
+
+        for relationship in cls.__mapper__.relationships:
+            if not relationship.uselist or \
+                    relationship.lazy != 'joined' and \
+                    relationship.key not in expand:
+                continue
+
+            (local, remote), = relationship.local_remote_pairs
+            model = relationship.mapper.class_
+            children = select(model.get_json_columns(depth=depth))\
+                .where(remote == local).correlate(cls.__table__)\
+                .alias(relationship.key)
+            columns.append(select([func.coalesce(
+                func.json_agg(aggregate_order_by(
+                    literal_column(children.name), children.c.id)),
+                literal_column("'[]'::json"))]).select_from(children)
+                .as_scalar()
+                .label(relationship.key))
+
+        return columns
+
+    @classmethod
+    def get_parent_column(cls):
+        if not cls.scope_path:
+            return None
+
+        column, = getattr(cls, cls.scope_path[0]).property.local_columns
+
+        return column
+
+    @classmethod
+    def get_scoped_parents(cls):
+        # The foreign keys of the model that reference records of an
+        # organization, with the model of the referenced records.
+        return [(column, relationship.mapper.class_)
+                for relationship in cls.__mapper__.relationships
+                if not relationship.uselist and
+                relationship.mapper.class_.scope_path is not None
+                for column in relationship.local_columns]
+
+    @classmethod
+    def get_serializer(cls):
+        # The serialized attributes only depend on the model, so they are
+        # listed once per model instead of on every serialized record.
+        serializer = cls.__dict__.get('_serializer')
+
+        if serializer is None:
+            columns = []
+
+            # The converter of each column depends only on its type, so
+            # it is decided here instead of on every serialized value.
+            for column in cls.__table__.columns:
+                if column.key in cls.hidden_columns:
+                    continue
+
+                if isinstance(column.type, (sqltypes.Date, sqltypes.DateTime,
+                                            sqltypes.Time)):
+                    columns.append((column.key, isoformat))
+                elif isinstance(column.type, sqltypes.Numeric):
+                    columns.append((column.key, str))
+                else:
+                    columns.append((column.key, None))
+
+            children = tuple(relationship.key for relationship
+                             in cls.__mapper__.relationships
+                             if relationship.uselist)
+            serializer = (tuple(columns), children)
+            cls._serializer = serializer
+
+        return serializer
+
+    @classmethod
+    def get_sort_columns(cls, sort=None):
+        key = sort or cls.sort_key
+
+        if key:
+            return getattr(cls, key.lstrip('-')), cls.id
+
+        return cls.id,
+
+    @classmethod
+    def get_sort_values(cls, record, sort=None):
+        return [getattr(record, col.key)
+                for col in cls.get_sort_columns(sort)]
+
+    @classmethod
+    def get_unauthorized_rows(cls, rows, user):
+        if cls.scope_path is None:
+            return set()
+
+        if not cls.scope_path:
+            if user.is_super:
+                return set()
+
+            return {index for index, row in enumerate(rows)
+                    if 'organization_id' in row and
+                    row['organization_id'] != user.organization_id}
+
+        # Every parent the rows reference must be visible to the user, not
+        # only the one of the scope path, e.g. the position and the shift
+        # of an employee besides its department.  Rows may only contain
+        # some of the keys, like the changes of a PATCH.
+        unauthorized = set()
+
+        for column, parent in cls.get_scoped_parents():
+            values = {row[column.key] for row in rows
+                      if row.get(column.key) is not None}
+
+            if not values:
+                continue
+
+            ids = parent.get_visible_ids(values, user)
+            unauthorized.update(index for index, row in enumerate(rows)
+                                if row.get(column.key) is not None and
+                                row[column.key] not in ids)
+
+        return unauthorized
+
     @classmethod
     def get_unique_constraints(cls):
         u_contraints = []
@@ -55,15 +414,141 @@ class ModelMixin(object):
 
         return u_contraints
 
+    @classmethod
+    def get_version_tables(cls, expand=()):
+        # The tables that can change a response: the ones joined to scope
+        # the records to an organization, and the collections that to_dict
+        # includes, which are the eagerly loaded and the expanded ones.
+        cache = cls.__dict__.get('_version_tables')
+
+        if cache is None:
+            cache = cls._version_tables = {}
+
+        key = tuple(sorted(expand))
+
+        if key not in cache:
+            statement = cls.filter_by_organization(cls.query, 0).statement
+            names = {table.name for table
+                     in find_tables(statement)}
+            models = [cls, *(getattr(cls, key).property.mapper.class_
+                             for key in expand)]
+            visited = set()
+
+            while models:
+                model = models.pop()
+
+                if model not in visited:
+                    visited.add(model)
+                    names.add(model.__tablename__)
+                    models.extend(relationship.mapper.class_
+                                  for relationship
+                                  in model.__mapper__.relationships
+                                  if relationship.uselist and
+                                  relationship.lazy == 'joined')
+
+            cache[key] = tuple(sorted(names))
+
+        return cache[key]
+
+    @classmethod
+    def get_visible_ids(cls, ids, user):
+        query = cls.scoped_query(user, allow_super=True)\
+            .filter(cls.id.in_(ids)).with_entities(cls.id)
+
+        return {_id for _id, in query}
+
     def inactivate(self):
-        self.is_active = False
-        self.save_to_db()
+        # Inactivated as in a bulk request, so a DELETE also reaches the
+        # collections of activation_cascade.
+        self.set_active([self.id], False)
+
+    @classmethod
+    def insert_many(cls, records):
+        table = cls.__table__
+        sequence = func.pg_get_serial_sequence(table.name, 'id')
+        rows = []
+
+        # The rows are returned by the INSERT itself, server defaults
+        # included, so the records do not need to be read again.  All the
+        # statements run in one transaction.
+        for i in range(0, len(records), BULK_INSERT_SIZE):
+            batch = records[i:i + BULK_INSERT_SIZE]
+            # PostgreSQL does not return the rows in the order of VALUES,
+            # so the ids are taken from the sequence first and the rows
+            # are matched to the records by id.
+            ids = [_id for _id, in db.session.execute(
+                select([func.nextval(sequence)])
+                .select_from(func.generate_series(1, len(batch))))]
+            values = [dict(record.get_column_values(), id=_id)
+                      for _id, record in zip(ids, batch)]
+            returned = {row.id: row for row in db.session.execute(
+                table.insert().values(values).returning(*table.columns))}
+            rows.extend(returned[_id] for _id in ids)
+
+        db.session.commit()
+
+        return rows
+
+    def insert_to_db(self):
+        return self.insert_many([self])[0]
+
+    @classmethod
+    def is_parent_authorized(cls, data, user):
+        return not cls.get_unauthorized_rows([data], user)
+
+    @classmethod
+    def iter_dicts(cls, rows, fields=None, depth=None):
+        # The collections are read once per batch of rows.
+        rows = iter(rows)
+        batch = list(islice(rows, STREAM_BATCH_SIZE))
+
+        while batch:
+            yield from cls.rows_to_dicts(batch, fields, depth)
+
+            batch = list(islice(rows, STREAM_BATCH_SIZE))
+
+    @classmethod
+    def list_query(cls, user, parent_id=None, filters=(), sort=None):
+        if cls.parent_key:
+            query = cls.scoped_query(user, allow_super=True)\
+                .filter(getattr(cls, cls.parent_key) == parent_id)
+        else:
+            query = cls.scoped_query(user)
+
+        return cls.sort_query(query.filter(*filters), sort)
+
+    @classmethod
+    def load_fields(cls, query, fields):
+        if not fields:
+            return query
+
+        # Only the requested columns are selected and relationships are
+        # left unloaded, so to_dict only serializes the requested fields.
+        # The id is always loaded because it identifies the record.
+        return query.options(load_only('id', *fields), lazyload('*'))
+
+    @classmethod
+    def normalize_value(cls, key, value):
+        # Dates and times are received as strings and numerics as floats,
+        # convert them so they can be compared with the values read from
+        # the database.
+        if isinstance(value, str):
+            try:
+                return cls.parse_value(key, value)
+            except ValueError:
+                pass
+        elif isinstance(value, float) and \
+                isinstance(cls.__table__.columns[key].type, sqltypes.Numeric):
+            return Decimal(str(value))
+
+        return value
 
     @classmethod
     def parse_model(cls):
         parsed_model = {
             'keys': [],
             'excluded': [],
+            'read_only': [],
             'unique': [],
             'nullable': [],
             'int': [],
@@ -74,7 +559,7 @@ class ModelMixin(object):
 
         for col in cls.__table__.columns:
             if col.key not in ['id', 'created_on', 'current_login',
-                               'last_login', 'login_count']:
+                               'last_login', 'login_count', 'token_version']:
                 parsed_model['keys'].append(col.key)
                 if col.nullable:
                     parsed_model['nullable'].append(col.key)
@@ -87,7 +572,14 @@ class ModelMixin(object):
                     parsed_model['bool'].append(col.key)
                 else:
                     parsed_model['str'].append(col.key)
+            else:
+                parsed_model['read_only'].append(col.key)
 
+        # The collections included in the records are also sent back with
+        # them, but they can not be changed through the record.
+        parsed_model['read_only'].extend(
+            relationship.key for relationship in cls.__mapper__.relationships
+            if relationship.uselist)
         parsed_model['unique'] = cls.get_unique_constraints()
         parsed_model['excluded'] = list(cls.exclude_from_update) \
             if cls.exclude_from_update else []
@@ -100,26 +592,201 @@ class ModelMixin(object):
 
         return parsed_model
 
+    @classmethod
+    def parse_value(cls, key, value):
+        col_type = cls.__table__.columns[key].type
+
+        if isinstance(col_type, sqltypes.Boolean):
+            if value.lower() not in ('true', 'false'):
+                raise ValueError(f'Valor booleano no válido: "{value}".')
+            return value.lower() == 'true'
+        elif isinstance(col_type, sqltypes.Integer):
+            return int(value)
+        elif isinstance(col_type, sqltypes.Numeric):
+            try:
+                return Decimal(value)
+            except InvalidOperation:
+                raise ValueError(f'Valor numérico no válido: "{value}".')
+        elif isinstance(col_type, sqltypes.DateTime):
+            return datetime.fromisoformat(value)
+        elif isinstance(col_type, sqltypes.Date):
+            return date.fromisoformat(value)
+        elif isinstance(col_type, sqltypes.Time):
+            return time.fromisoformat(value)
+        elif isinstance(col_type, sqltypes.Enum) and \
+                value not in col_type.enums:
+            raise ValueError(f'Valor no válido: "{value}".')
+
+        return value
+
+    def patch(self, data):
+        changed = False
+
+        for key, value in data.items():
+            value = self.normalize_value(key, value)
+
+            if getattr(self, key) != value:
+                setattr(self, key, value)
+                changed = True
+
+        # Nothing is written when none of the values changed, otherwise
+        # the UPDATE only sets the modified columns.  The record is read
+        # back to return the values as stored by the database.
+        if changed:
+            self.save_to_db()
+            db.session.refresh(self)
+
+        return changed
+
+    @classmethod
+    def row_to_dict(cls, row):
+        output = cls.serialize(dict(row.items()))
+
+        # A new record has no children, which the eagerly loaded
+        # collections would have returned as empty lists.
+        for relationship in cls.__mapper__.relationships:
+            if relationship.lazy == 'joined' and relationship.uselist:
+                output[relationship.key] = []
+
+        return output
+
+    @classmethod
+    def rows_to_dicts(cls, rows, fields=None, depth=None):
+        # The rows of select_rows are serialized as the records would be,
+        # including the eagerly loaded collections unless fields are given.
+        columns, _ = cls.get_serializer()
+        keys = [key for key, _ in columns
+                if not fields or key == 'id' or key in fields]
+        output = [cls.serialize({key: getattr(row, key) for key in keys})
+                  for row in rows]
+
+        if fields or depth == 0 or not output:
+            return output
+
+        depth = None if depth is None else depth - 1
+
+        for relationship in cls.__mapper__.relationships:
+            if relationship.lazy != 'joined' or not relationship.uselist:
+                continue
+
+            (local, remote), = relationship.local_remote_pairs
+            model = relationship.mapper.class_
+            children = defaultdict(list)
+            query = model.select_rows(db.session.query(model))\
+                .filter(remote.in_(list({item[local.key]
+                                            for item in output})))\
+                .order_by(model.id)
+
+            for child in model.rows_to_dicts(query.all(), depth=depth):
+                children[child[remote.key]].append(child)
+
+            for item in output:
+                item[relationship.key] = children.get(item[local.key], [])
+
+        return output
+
     def save_to_db(self):
         db.session.add(self)
         db.session.commit()
 
-    def to_dict(self):
+    @classmethod
+    def scoped_query(cls, user, allow_super=False):
+        if allow_super and user.is_super:
+            return cls.query
+
+        return cls.filter_by_organization(cls.query, user.organization_id)
+
+    @classmethod
+    def select_rows(cls, query, fields=None, sort=None):
+        # Selecting the columns instead of the model skips the identity
+        # map and the state of the records, which lists do not need.
+        columns = cls.__table__.columns
+
+        if fields:
+            keys = {'id', *fields,
+                    *(column.key for column in cls.get_sort_columns(sort))}
+            columns = [column for column in columns if column.key in keys]
+
+        return query.with_entities(*columns)
+
+    @classmethod
+    def serialize(cls, values, depth=None):
+        # Only the attributes present in values are serialized, so columns
+        # left out by load_only or expired after a commit are skipped.
+        columns, children = cls.get_serializer()
         output = {}
 
-        for k, v in self:
-            if type(v) == collections.InstrumentedList:
-                output[k] = [item.to_dict() for item in v]
-            elif isinstance(v, (date, datetime, time)):
-                output[k] = v.isoformat()
-            elif isinstance(v, (float, Decimal)):
-                output[k] = str(v)
-            else:
-                output[k] = v
+        for key, convert in columns:
+            if key in values:
+                value = values[key]
+
+                if convert is None or value is None:
+                    output[key] = value
+                else:
+                    output[key] = convert(value)
+
+        if depth is None or depth > 0:
+            depth = None if depth is None else depth - 1
+
+            for key in children:
+                if key in values:
+                    output[key] = [item.to_dict(depth=depth)
+                                   for item in values[key]]
 
         return output
 
+    @classmethod
+    def set_active(cls, ids, is_active, user=None):
+        table = cls.__table__
+
+        if user is not None:
+            # The records of other organizations are left out by the
+            # same statement, so they cannot change between a check and
+            # the update.
+            ids = cls.scoped_query(user, allow_super=True)\
+                .filter(cls.id.in_(ids)).with_entities(cls.id).subquery()
+
+        result = db.session.execute(
+            table.update()
+            .where(table.c.id.in_(ids))
+            .where(table.c.is_active.is_distinct_from(is_active))
+            .values(is_active=is_active)
+            .returning(table.c.id)
+        )
+        changed = [_id for _id, in result]
+
+        if changed and not is_active:
+            cls.cascade_inactivation(changed)
+
+        db.session.commit()
+
+        return changed
+
+    @classmethod
+    def sort_query(cls, query, sort=None):
+        columns = cls.get_sort_columns(sort)
+
+        if sort and sort.startswith('-'):
+            columns = [column.desc() for column in columns]
+
+        return query.order_by(*columns)
+
+    def to_dict(self, expand=(), depth=None):
+        # Relationships that are not eagerly loaded are only serialized
+        # when requested, so load them before reading the attributes.
+        for key in expand:
+            getattr(self, key)
+
+        return self.serialize(self.__dict__, depth)
+
     def update(self, data):
+        # Inactivating the record also reaches the collections of
+        # activation_cascade, as the activate endpoint does.
+        if data.get('is_active') is False and \
+                'is_active' not in self.exclude_from_update and \
+                getattr(self, 'is_active', False):
+            self.cascade_inactivation([self.id])
+
         for key, value in data.items():
             if key is 'password':
                 setattr(self, 'password_hash', generate_password_hash(value))
@@ -128,3 +795,23 @@ class ModelMixin(object):
         self.save_to_db()
 
         return self.id, self
+
+    @classmethod
+    def update_many(cls, updates):
+        table = cls.__table__
+        keys = {key for changes in updates.values() for key in changes}
+        values = {}
+
+        # Every record is updated by the same statement, each column
+        # takes the value of its record from a CASE on the id.
+        for key in keys:
+            column = table.columns[key]
+            whens = {_id: literal(changes[key], column.type)
+                     for _id, changes in updates.items() if key in changes}
+
+            values[key] = case(whens, value=table.c.id, else_=column)
+
+        db.session.execute(table.update()
+                           .where(table.c.id.in_(list(updates)))
+                           .values(values))
+        db.session.commit()
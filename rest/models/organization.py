@@ -1,4 +1,4 @@
-from sqlalchemy import UniqueConstraint
+from sqlalchemy import false, UniqueConstraint
 
 from db import db
 from models.creditor import CreditorModel
@@ -16,6 +16,7 @@ class OrganizationModel(ModelMixin, db.Model):
                                        name='organization_'
                                             'organization_name_uindex'),)
     exclude_from_update = ()
+    scope_path = ()
 
     id = db.Column(db.Integer, primary_key=True)
     organization_name = db.Column(db.String(80), nullable=False)
@@ -23,38 +24,36 @@ class OrganizationModel(ModelMixin, db.Model):
 
     app_users = db.relationship(AppUserModel,
                                 backref='organization',
-                                lazy='joined')
+                                lazy='select')
 
     employment_positions = db.relationship(EmploymentPositionModel,
                                            backref='organization',
-                                           lazy='joined')
+                                           lazy='select')
 
     departments = db.relationship(DepartmentModel,
                                   backref='organization',
-                                  lazy='joined')
+                                  lazy='select')
 
     shifts = db.relationship(ShiftModel,
                              backref='organization',
-                             lazy='joined')
+                             lazy='select')
 
     uniform_items = db.relationship(UniformItemModel,
                                     backref='organization',
-                                    lazy='joined')
+                                    lazy='select')
 
     creditors = db.relationship(CreditorModel,
                                 backref='organization',
-                                lazy='joined')
+                                lazy='select')
 
     def __init__(self, organization_name, is_active):
         self.organization_name = organization_name
         self.is_active = is_active
 
     @classmethod
-    def find_by_id(cls, _id, user):
-        if user.is_super or user.organization_id == _id:
-            return cls.query.filter_by(id=_id).first()
-
-    @classmethod
-    def find_all(cls, user):
+    def list_query(cls, user, parent_id=None, filters=(), sort=None):
+        # Only super users may list the organizations.
         if user.is_super:
-            return cls.query.all()
+            return cls.sort_query(cls.query.filter(*filters), sort)
+
+        return cls.query.filter(false())
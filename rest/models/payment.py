@@ -1,3 +1,5 @@
+from sqlalchemy import Index
+
 from db import db
 from models.mixin import ModelMixin
 from models.deduction_detail import DeductionDetailModel
@@ -6,7 +8,11 @@ from models.payment_detail import PaymentDetailModel
 
 class PaymentModel(ModelMixin, db.Model):
     __tablename__ = 'payment'
+    __table_args__ = (Index('payment_employee_id_payment_date_index',
+                            'employee_id', 'payment_date'),)
     exclude_from_update = ('employee_id',)
+    scope_path = ('employee', 'department')
+    parent_key = 'employee_id'
 
     id = db.Column(db.Integer, primary_key=True)
     payment_date = db.Column(db.Date, nullable=False)
@@ -27,22 +33,3 @@ class PaymentModel(ModelMixin, db.Model):
         self.payment_date = payment_date
         self.document_number = document_number
         self.employee_id = employee_id
-
-    @classmethod
-    def find_by_id(cls, _id, user):
-        from models.employee import EmployeeModel
-
-        record = cls.query.filter_by(id=_id).first()
-
-        if record:
-            if EmployeeModel.find_by_id(record.employee_id, user):
-                return record
-
-    @classmethod
-    def find_all(cls, user, employee_id):
-        from models.employee import EmployeeModel
-
-        records = cls.query.filter_by(employee_id=employee_id).all()
-
-        if records and EmployeeModel.find_by_id(employee_id, user):
-            return records
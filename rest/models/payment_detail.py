@@ -6,6 +6,8 @@ from models.mixin import ModelMixin
 class PaymentDetailModel(ModelMixin, db.Model):
     __tablename__ = 'payment_detail'
     exclude_from_update = ('payment_id',)
+    scope_path = ('payment', 'employee', 'department')
+    parent_key = 'payment_id'
 
     id = db.Column(db.Integer, primary_key=True)
     payment_type = db.Column(PAYMENT_TYPE, nullable=False)
@@ -25,22 +27,3 @@ class PaymentDetailModel(ModelMixin, db.Model):
         self.se_deduction = se_deduction
         self.isr_deduction = isr_deduction
         self.payment_id = payment_id
-
-    @classmethod
-    def find_by_id(cls, _id, user):
-        from models.payment import PaymentModel
-
-        record = cls.query.filter_by(id=_id).first()
-
-        if record:
-            if PaymentModel.find_by_id(record.payment_id, user):
-                return record
-
-    @classmethod
-    def find_all(cls, user, payment_id):
-        from models.payment import PaymentModel
-
-        records = cls.query.filter_by(payment_id=payment_id).all()
-
-        if records and PaymentModel.find_by_id(payment_id, user):
-            return records
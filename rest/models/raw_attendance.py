@@ -7,6 +7,7 @@ class RawAttendanceModel(ModelMixin, db.Model):
     __tablename__ = 'raw_attendance'
 
     exclude_from_update = ('stgid', 'userid', 'att_time', 'att_type')
+    scope_path = ('employee', 'department')
 
     id = db.Column(db.Integer, primary_key=True)
     stgid = db.Column(db.String(20), nullable=False)
@@ -15,6 +16,13 @@ class RawAttendanceModel(ModelMixin, db.Model):
     att_type = db.Column(ATT_TYPE, nullable=False)
     was_processed = db.Column(db.Boolean, nullable=False, default=False)
 
+    # userid is the employee id registered in the clock, which is not
+    # declared as a foreign key.
+    employee = db.relationship(
+        'EmployeeModel',
+        primaryjoin='EmployeeModel.id == foreign(RawAttendanceModel.userid)',
+        viewonly=True)
+
     def __init__(self, stgid, userid, att_time, att_type):
         self.stgid = stgid
         self.userid = userid
@@ -22,26 +30,6 @@ class RawAttendanceModel(ModelMixin, db.Model):
         self.att_type = att_type
 
     @classmethod
-    def find_by_id(cls, _id, user):
-        from models.employee import EmployeeModel
-
-        record = cls.query.filter_by(id=_id).first()
-
-        if record:
-            if EmployeeModel.find_by_id(record.userid, user):
-                return record
-
-    @classmethod
-    def find_all(cls, user):
-        from models.department import DepartmentModel
-        from models.employee import EmployeeModel
-
-        departments = DepartmentModel.find_all(user)
-        d_ids = [department.id for department in departments]
-
-        employees = EmployeeModel.query.filter(
-            EmployeeModel.department_id.in_(d_ids)).all()
-        e_ids = [employee.id for employee in employees]
-
-        return cls.query.filter(cls.userid.in_(e_ids),
-                                cls.was_processed==False).all()
+    def list_query(cls, user, parent_id=None, filters=(), sort=None):
+        return super().list_query(user, parent_id, filters, sort)\
+            .filter(cls.was_processed.is_(False))
@@ -12,6 +12,8 @@ class ScheduleModel(ModelMixin, db.Model):
                                        name='schedule_department_id_'
                                             'start_date_uindex'),)
     exclude_from_update = ('department_id',)
+    scope_path = ('department',)
+    parent_key = 'department_id'
 
     id = db.Column(db.Integer, primary_key=True)
     start_date = db.Column(db.Date, nullable=False)
@@ -23,23 +25,9 @@ class ScheduleModel(ModelMixin, db.Model):
                                        backref='schedule',
                                        lazy='joined')
 
+    department = db.relationship(DepartmentModel,
+                                 lazy='select')
+
     def __init__(self, start_date, department_id):
         self.start_date = start_date
         self.department_id = department_id
-
-    @classmethod
-    def find_by_id(cls, _id, user):
-        record = cls.query.filter_by(id=_id).first()
-
-        if record:
-            if DepartmentModel.find_by_id(record.department_id, user):
-                return record
-
-    @classmethod
-    def find_all(cls, user, department_id):
-        from models.department import DepartmentModel
-
-        records = cls.query.filter_by(department_id=department_id).all()
-
-        if records and DepartmentModel.find_by_id(department_id, user):
-            return records
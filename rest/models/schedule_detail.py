@@ -10,6 +10,8 @@ class ScheduleDetailModel(ModelMixin, db.Model):
                                        name='schedule_detail_employee_id_'
                                             'schedule_id_uindex'),)
     exclude_from_update = ('schedule_id',)
+    scope_path = ('schedule', 'department')
+    parent_key = 'schedule_id'
 
     id = db.Column(db.Integer, primary_key=True)
     day_1_start = db.Column(db.DateTime)
@@ -71,20 +73,10 @@ class ScheduleDetailModel(ModelMixin, db.Model):
         self.schedule_id = schedule_id
 
     @classmethod
-    def find_by_id(cls, _id, user):
+    def get_scoped_parents(cls):
         from models.employee import EmployeeModel
 
-        record = cls.query.filter_by(id=_id).first()
-
-        if record:
-            if EmployeeModel.find_by_id(record.employee_id, user):
-                return record
-
-    @classmethod
-    def find_all(cls, user, schedule_id):
-        from models.schedule import ScheduleModel
-
-        records = cls.query.filter_by(schedule_id=schedule_id).all()
-
-        if records and ScheduleModel.find_by_id(schedule_id, user):
-            return records
+        # The employee has no relationship to the model.
+        return super().get_scoped_parents() + [
+            (cls.employee_id, EmployeeModel)
+        ]
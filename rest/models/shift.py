@@ -14,6 +14,7 @@ class ShiftModel(ModelMixin, db.Model):
                                        name='shift_shift_name_organization_id_'
                                             'uindex'),)
     exclude_from_update = ('organization_id', 'is_active')
+    scope_path = ()
 
     id = db.Column(db.Integer, primary_key=True)
     shift_name = db.Column(db.String(80), nullable=False)
@@ -60,7 +61,7 @@ class ShiftModel(ModelMixin, db.Model):
 
     employees = db.relationship(EmployeeModel,
                                 backref='shift',
-                                lazy='joined')
+                                lazy='select')
 
     def __init__(self, shift_name, weekly_hours, is_rotating,
                  payment_period, break_length, is_break_included_in_shift,
@@ -144,17 +145,3 @@ class ShiftModel(ModelMixin, db.Model):
                 'fixed_end_hour_sunday')
 
             self.rest_day = kwargs.get('rest_day')
-
-    @classmethod
-    def find_by_id(cls, _id, user):
-        from models.organization import OrganizationModel
-
-        record = cls.query.filter_by(id=_id).first()
-
-        if record:
-            if OrganizationModel.find_by_id(record.organization_id, user):
-                return record
-
-    @classmethod
-    def find_all(cls, user):
-        return cls.query.filter_by(organization_id=user.organization_id).all()
@@ -5,6 +5,8 @@ from models.mixin import ModelMixin
 class SickNoteModel(ModelMixin, db.Model):
     __tablename__ = 'sick_note'
     exclude_from_update = ('employee_id',)
+    scope_path = ('employee', 'department')
+    parent_key = 'employee_id'
 
     id = db.Column(db.Integer, primary_key=True)
     sick_note_date = db.Column(db.Date, nullable=False)
@@ -22,22 +24,3 @@ class SickNoteModel(ModelMixin, db.Model):
         self.number_of_hours_approved = number_of_hours_approved
         self.date_received = date_received
         self.employee_id = employee_id
-
-    @classmethod
-    def find_by_id(cls, _id, user):
-        from models.employee import EmployeeModel
-
-        record = cls.query.filter_by(id=_id).first()
-
-        if record:
-            if EmployeeModel.find_by_id(record.employee_id, user):
-                return record
-
-    @classmethod
-    def find_all(cls, user, employee_id):
-        from models.employee import EmployeeModel
-
-        records = cls.query.filter_by(employee_id=employee_id).all()
-
-        if records and EmployeeModel.find_by_id(employee_id, user):
-            return records
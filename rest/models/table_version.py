@@ -0,0 +1,29 @@
+from db import db
+
+
+class TableVersionModel(db.Model):
+    __tablename__ = 'table_version'
+
+    # The version of each table is incremented by a trigger on every
+    # statement that changes rows of the table, for each organization of
+    # the rows.  Tables shared by all organizations use the organization 0.
+    table_name = db.Column(db.String(63), primary_key=True)
+    organization_id = db.Column(db.Integer, primary_key=True, default=0)
+    version = db.Column(db.BigInteger, nullable=False, default=0)
+
+    @classmethod
+    def find_versions(cls, tables, organization_id=None):
+        # Without an organization the versions of all of them are added,
+        # which only grow, so their sum changes with any of them.
+        query = db.session.query(cls.table_name, db.func.sum(cls.version))\
+            .filter(cls.table_name.in_(tables))\
+            .group_by(cls.table_name)
+
+        if organization_id is not None:
+            query = query.filter(
+                cls.organization_id.in_((0, organization_id)))
+
+        versions = dict(query)
+
+        # Tables that have not changed yet do not have a row.
+        return tuple(versions.get(table, 0) for table in tables)
@@ -11,6 +11,7 @@ class UniformItemModel(ModelMixin, db.Model):
                                        name='uniform_item_item_name_'
                                             'organization_id_uindex'),)
     exclude_from_update = ('organization_id',)
+    scope_path = ()
 
     id = db.Column(db.Integer, primary_key=True)
     item_name = db.Column(db.String(80), nullable=False)
@@ -25,17 +26,3 @@ class UniformItemModel(ModelMixin, db.Model):
     def __init__(self, item_name, organization_id):
         self.item_name = item_name
         self.organization_id = organization_id
-
-    @classmethod
-    def find_by_id(cls, _id, user):
-        from models.organization import OrganizationModel
-
-        record = cls.query.filter_by(id=_id).first()
-
-        if record:
-            if OrganizationModel.find_by_id(record.organization_id, user):
-                return record
-
-    @classmethod
-    def find_all(cls, user):
-        return cls.query.filter_by(organization_id=user.organization_id).all()
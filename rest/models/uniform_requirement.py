@@ -10,6 +10,8 @@ class UniformRequirementModel(ModelMixin, db.Model):
                                        name='uniform_requirement_employee_id_'
                                             'uniform_item_id_uindex'),)
     exclude_from_update = ('employee_id', 'uniform_item_id')
+    scope_path = ('employee', 'department')
+    parent_key = 'employee_id'
 
     id = db.Column(db.Integer, primary_key=True)
     employee_id = db.Column(db.Integer,
@@ -28,22 +30,22 @@ class UniformRequirementModel(ModelMixin, db.Model):
         self.uniform_size_id = uniform_size_id
 
     @classmethod
-    def find_by_id(cls, _id, user):
-        from models.employee import EmployeeModel
+    def filter_by_organization(cls, query, organization_id):
         from models.uniform_item import UniformItemModel
 
-        record = cls.query.filter_by(id=_id).first()
+        query = query.join(UniformItemModel,
+                           UniformItemModel.id == cls.uniform_item_id)\
+            .filter(UniformItemModel.organization_id == organization_id)
 
-        if record:
-            if UniformItemModel.find_by_id(record.uniform_item_id, user) and \
-                    EmployeeModel.find_by_id(record.employee_id, user):
-                return record
+        return super().filter_by_organization(query, organization_id)
 
     @classmethod
-    def find_all(cls, user, employee_id):
-        from models.employee import EmployeeModel
-
-        records = cls.query.filter_by(employee_id=employee_id).all()
+    def get_scoped_parents(cls):
+        from models.uniform_item import UniformItemModel
+        from models.uniform_size import UniformSizeModel
 
-        if records and EmployeeModel.find_by_id(employee_id, user):
-            return records
+        # The uniform item and size have no relationship to the model.
+        return super().get_scoped_parents() + [
+            (cls.uniform_item_id, UniformItemModel),
+            (cls.uniform_size_id, UniformSizeModel)
+        ]
@@ -10,6 +10,8 @@ class UniformSizeModel(ModelMixin, db.Model):
                                        name='uniform_size_size_description_'
                                             'uniform_item_id_uindex'),)
     exclude_from_update = ('uniform_item_id',)
+    scope_path = ('uniform_item',)
+    parent_key = 'uniform_item_id'
 
     id = db.Column(db.Integer, primary_key=True)
     size_description = db.Column(db.String(20), nullable=False)
@@ -20,22 +22,3 @@ class UniformSizeModel(ModelMixin, db.Model):
     def __init__(self, size_description, uniform_item_id):
         self.size_description = size_description
         self.uniform_item_id = uniform_item_id
-
-    @classmethod
-    def find_by_id(cls, _id, user):
-        from models.uniform_item import UniformItemModel
-
-        record = cls.query.filter_by(id=_id).first()
-
-        if record:
-            if UniformItemModel.find_by_id(record.uniform_item_id, user):
-                return record
-
-    @classmethod
-    def find_all(cls, user, item_id):
-        from models.uniform_item import UniformItemModel
-
-        records = cls.query.filter_by(uniform_item_id=item_id).all()
-
-        if records and UniformItemModel.find_by_id(item_id, user):
-            return records
@@ -13,6 +13,8 @@ class AppUserModel(ModelMixin, db.Model):
                                        name='app_user_email_uindex')
                       )
     exclude_from_update = ('organization_id', 'is_active')
+    hidden_columns = ('token_version',)
+    scope_path = ()
 
     id = db.Column(db.Integer, primary_key=True)
     username = db.Column(db.String(80), nullable=False, unique=True)
@@ -26,6 +28,11 @@ class AppUserModel(ModelMixin, db.Model):
     current_login = db.Column(db.DateTime)
     last_login = db.Column(db.DateTime)
     login_count = db.Column(db.Integer, default=0)
+    # Incremented by a trigger when the user is inactivated or its
+    # organization, permissions or password change, which invalidates the
+    # tokens issued before.
+    token_version = db.Column(db.Integer, nullable=False,
+                              server_default=text('0'))
     organization_id = db.Column(db.Integer,
                                 db.ForeignKey('organization.id'),
                                 nullable=False, index=True)
@@ -45,22 +52,25 @@ class AppUserModel(ModelMixin, db.Model):
         return check_password_hash(self.password_hash, password)
 
     @classmethod
-    def find_by_id(cls, _id, user=None):
-        from models.organization import OrganizationModel
-
-        record = cls.query.filter_by(id=_id).first()
+    def find_by_id(cls, _id, user=None, fields=None):
+        if user:
+            return super().find_by_id(_id, user, fields)
 
-        if record:
-            if user:
-                if OrganizationModel.find_by_id(record.organization_id, user):
-                    return record
-            else:
-                return record
-
-    @classmethod
-    def find_all(cls, user):
-        return cls.query.filter_by(organization_id=user.organization_id).all()
+        return cls.query.filter_by(id=_id).first()
 
     @classmethod
     def find_by_username(cls, username):
         return cls.query.filter_by(username=username).first()
+
+    @classmethod
+    def find_token_version(cls, _id):
+        from models.organization import OrganizationModel
+
+        # Inactive users and the users of inactive organizations have no
+        # version, so their tokens are rejected even where the triggers
+        # that increment it were not created.
+        return db.session.query(cls.token_version)\
+            .join(OrganizationModel, OrganizationModel.id ==
+                  cls.organization_id)\
+            .filter(cls.id == _id, cls.is_active.is_(True),
+                    OrganizationModel.is_active.is_(True)).scalar()
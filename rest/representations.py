@@ -0,0 +1,150 @@
+import json
+from collections import OrderedDict
+from datetime import date, datetime, time
+from decimal import Decimal
+
+import msgpack
+from flask import current_app, make_response
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def add_vary(response):
+    """
+    Add Accept to the Vary header of the responses that depend on it.
+
+    The representation is negotiated with the Accept header, so caches
+    must not send a response to a client that accepts another one.
+
+    :param response: The response of the request
+    :return: The response
+    """
+    if response.status_code == 304 or \
+            response.mimetype in REPRESENTATIONS:
+        response.vary.add('Accept')
+
+    return response
+
+
+def default(value):
+    """
+    Convert the values that the JSON encoders do not support natively.
+
+    Decimals are sent as strings so they keep their precision.
+
+    :param value: The value to convert
+    :return: The JSON compatible value
+    """
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, (date, datetime, time)):
+        return value.isoformat()
+
+    raise TypeError(f'Object of type {type(value).__name__} is not JSON '
+                    f'serializable')
+
+
+def dumps(data):
+    """
+    Encode the data of a response as JSON.
+
+    The standard library encoder is used with the RESTFUL_JSON settings of
+    the app, which writes the same document as Flask-RESTful.  When the
+    ORJSON setting is on and orjson is installed, the document is written
+    by orjson instead, in a single line and without escaping non-ASCII
+    characters.
+
+    :param data: The data to encode
+    :return: The JSON document
+    :rtype: str
+    """
+    if orjson is not None and current_app.config.get('ORJSON'):
+        return orjson.dumps(data, default=default).decode()
+
+    # A copy, so the indentation is not added to the config of the app.
+    settings = dict(current_app.config.get('RESTFUL_JSON', {}))
+
+    if current_app.debug:
+        settings.setdefault('indent', 4)
+
+    return json.dumps(data, default=default, **settings)
+
+
+def dumps_line(data):
+    """
+    Encode data as JSON in a single line, as required by NDJSON.
+
+    :param data: The data to encode
+    :return: The JSON document
+    :rtype: str
+    """
+    if orjson is not None and current_app.config.get('ORJSON'):
+        return orjson.dumps(data, default=default).decode()
+
+    return json.dumps(data, default=default)
+
+
+def dumps_list(batches):
+    """
+    Encode a list response in chunks, one per batch of records.
+
+    The chunks add up to the document that dumps would write for
+    {'list': records}, followed by a new line.
+
+    :param batches: The lists of records to encode
+    :return: A generator of the chunks of the document
+    """
+    # The separators and the indentation of the items are taken from a
+    # list of two placeholders encoded with the same settings.
+    head, separator, tail = dumps({'list': [0, 0]}).split('0')
+    indent = separator.rpartition('\n')[2] if '\n' in separator else ''
+    empty = True
+
+    for batch in batches:
+        yield (head if empty else separator) + separator.join(
+            dumps(record).replace('\n', '\n' + indent) for record in batch)
+
+        empty = False
+
+    yield dumps({'list': []}) + '\n' if empty else tail + '\n'
+
+
+def output_json(data, code, headers=None):
+    """
+    Make a JSON response, replacing the representation of Flask-RESTful.
+
+    :param data: The data of the response
+    :param code: The status code of the response
+    :param headers: The headers of the response
+    :return: A Flask response
+    """
+    response = make_response(dumps(data) + '\n', code)
+    response.headers.extend(headers or {})
+
+    return response
+
+
+def output_msgpack(data, code, headers=None):
+    """
+    Make a MessagePack response with the same values as the JSON one.
+
+    :param data: The data of the response
+    :param code: The status code of the response
+    :param headers: The headers of the response
+    :return: A Flask response
+    """
+    response = make_response(
+        msgpack.packb(data, default=default, use_bin_type=True), code)
+    response.headers.extend(headers or {})
+
+    return response
+
+
+# Media types that the API can respond with, JSON being the default one.
+REPRESENTATIONS = OrderedDict([
+    ('application/json', output_json),
+    ('application/msgpack', output_msgpack)
+])
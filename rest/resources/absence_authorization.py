@@ -5,7 +5,10 @@ from resources.mixin import ListMixin, ResourceMixin
 class AbsenceAuthorization(ResourceMixin):
     model = AbsenceAuthorizationModel
     parsed_model = model.parse_model()
+    filterable = ('absence_date',)
 
 
 class AbsenceAuthorizations(ListMixin):
     model = AbsenceAuthorizationModel
+    filterable = ('absence_date',)
+    sortable = ('absence_date',)
@@ -1,11 +1,19 @@
 from models.attendance import AttendanceModel
-from resources.mixin import ListMixin, ResourceMixin
+from resources.mixin import ExportMixin, ListMixin, ResourceMixin
 
 
 class Attendance(ResourceMixin):
     model = AttendanceModel
     parsed_model = model.parse_model()
+    filterable = ('work_day',)
 
 
 class Attendances(ListMixin):
     model = AttendanceModel
+    filterable = ('work_day',)
+    sortable = ('work_day',)
+
+
+class ExportAttendances(ExportMixin):
+    model = AttendanceModel
+    filterable = ('work_day',)
@@ -1,10 +1,12 @@
 from models.deduction import DeductionModel
-from resources.mixin import ActivateMixin, ListMixin, ResourceMixin
+from resources.mixin import ActivateMixin, ExportMixin, ListMixin, \
+    ResourceMixin
 
 
 class Deduction(ResourceMixin):
     model = DeductionModel
     parsed_model = model.parse_model()
+    filterable = ('creditor_id',)
 
 
 class ActivateDeduction(ActivateMixin):
@@ -13,3 +15,9 @@ class ActivateDeduction(ActivateMixin):
 
 class Deductions(ListMixin):
     model = DeductionModel
+    filterable = ('creditor_id',)
+
+
+class ExportDeductions(ExportMixin):
+    model = DeductionModel
+    filterable = ('creditor_id',)
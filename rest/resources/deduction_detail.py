@@ -1,11 +1,17 @@
 from models.deduction_detail import DeductionDetailModel
-from resources.mixin import ListMixin, ResourceMixin
+from resources.mixin import ExportMixin, ListMixin, ResourceMixin
 
 
 class DeductionDetail(ResourceMixin):
     model = DeductionDetailModel
     parsed_model = model.parse_model()
+    filterable = ('deduction_id',)
 
 
 class DeductionDetails(ListMixin):
     model = DeductionDetailModel
+    filterable = ('deduction_id',)
+
+
+class ExportDeductionDetails(ExportMixin):
+    model = DeductionDetailModel
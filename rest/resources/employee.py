@@ -5,6 +5,11 @@ from resources.mixin import ActivateMixin, ListMixin, ResourceMixin
 class Employee(ResourceMixin):
     model = EmployeeModel
     parsed_model = model.parse_model()
+    filterable = ('department_id', 'is_active', 'position_id')
+    expandable = ('emergency_contacts', 'health_permits', 'passports',
+                  'uniform_requirements', 'bank_accounts', 'dependents',
+                  'payments', 'deductions', 'attendances', 'sick_notes',
+                  'absence_authorizations')
 
 
 class ActivateEmployee(ActivateMixin):
@@ -12,4 +17,6 @@ class ActivateEmployee(ActivateMixin):
 
 
 class Employees(ListMixin):
-    model = EmployeeModel
\ No newline at end of file
+    model = EmployeeModel
+    filterable = ('department_id', 'is_active', 'position_id')
+    sortable = ('first_name',)
\ No newline at end of file
@@ -1,91 +1,400 @@
+import csv
+import hashlib
+import json
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from binascii import Error as Base64Error
+from datetime import datetime
+from io import StringIO
+from itertools import chain, islice
+
+from flask import current_app, request, Response, stream_with_context
 from flask_jwt import current_identity, jwt_required
-from flask_restful import reqparse, Resource
-from sqlalchemy.exc import SQLAlchemyError
+from flask_restful import abort, Resource
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+from werkzeug.exceptions import HTTPException
+from werkzeug.http import quote_etag
+
+from models.mixin import FILTER_OPERATORS, STREAM_BATCH_SIZE
+from models.table_version import TableVersionModel
+from representations import dumps_line, dumps_list, REPRESENTATIONS
+
+
+def compile_validator(parsed_model, partial=False):
+    converters = {}
+    # Records sent back as they were received include the values set by
+    # the database and the hash of the password, which can only be
+    # changed with password.  They are ignored.
+    ignored = {*parsed_model['read_only'], 'password_hash'}
+
+    for key in parsed_model['keys']:
+        if key == 'password_hash':
+            continue
+        if key in parsed_model['int']:
+            converters[key] = int
+        elif key in parsed_model['float']:
+            converters[key] = float
+        elif key in parsed_model['bool']:
+            converters[key] = to_bool
+        else:
+            converters[key] = str
+
+    required = tuple(
+        key for key in converters if key not in parsed_model['nullable'])
+
+    def validate(body):
+        if not isinstance(body, dict):
+            abort(400, message='El registro debe ser un objeto.')
+
+        data = {} if partial else dict.fromkeys(converters)
+
+        for key, value in body.items():
+            convert = converters.get(key)
+
+            if convert is None:
+                if key in ignored:
+                    continue
+
+                abort(400, message={key: 'El campo no es válido.'})
+
+            if value is None:
+                data[key] = None
+                continue
+
+            try:
+                data[key] = convert(value)
+            except (TypeError, ValueError):
+                abort(400, message={key: f'El valor "{value}" no es '
+                                         f'válido.'})
+
+        # Partial records only have to keep the fields they change.
+        for key in required:
+            if key in data and data[key] is None:
+                abort(400, message={key: 'El campo es requerido.'})
+
+        return data
+
+    return validate
+
+
+def generate_csv(keys, rows):
+    buffer = StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(keys)
+
+    for batch in iter_batches(rows):
+        writer.writerows([value.isoformat() if isinstance(value, datetime)
+                          else value for value in row] for row in batch)
+
+        yield buffer.getvalue()
+
+        buffer.seek(0)
+        buffer.truncate()
+
+    # Without rows only the header is left in the buffer.
+    if buffer.tell():
+        yield buffer.getvalue()
+
+
+def generate_ndjson(keys, rows):
+    for batch in iter_batches(rows):
+        yield ''.join(dumps_line(dict(zip(keys, row))) + '\n'
+                      for row in batch)
+
+
+def get_depth():
+    depth = request.args.get('depth')
+
+    if depth is None:
+        return None
+
+    if not depth.isdigit():
+        abort(400, message=f'El valor "{depth}" no es válido para depth.')
+
+    return int(depth)
+
+
+def get_etag(model, expand=()):
+    # The tag only depends on the versions of the tables, so an unchanged
+    # response is detected with one query and without serializing it.
+    # Super users and shared models, whose collections may hold records
+    # of any organization, depend on the versions of every organization.
+    organization_id = None if current_identity.is_super or \
+        model.scope_path is None else current_identity.organization_id
+    versions = TableVersionModel.find_versions(
+        model.get_version_tables(expand), organization_id)
+    value = f'{versions}-{current_identity.id}-{get_mediatype()}'
+
+    return hashlib.sha1(value.encode()).hexdigest()
+
+
+def get_fields(model):
+    fields = request.args.get('fields')
+
+    if not fields:
+        return None
+
+    keys = fields.split(',')
+
+    for key in keys:
+        if key not in model.__table__.columns or \
+                key in model.hidden_columns:
+            abort(400, message=f'El valor "{key}" no es válido para '
+                               f'fields.')
+
+    return keys
+
+
+def get_filter_args(model, reserved=()):
+    # Only the arguments named after a column of the model are filters,
+    # others, like the cache busters sent by some clients, are ignored.
+    return [(arg, value) for arg, value in request.args.items()
+            if arg not in reserved and
+            arg.partition('__')[0] in model.__table__.columns]
+
+
+def get_mediatype():
+    return request.accept_mimetypes.best_match(REPRESENTATIONS,
+                                               default='application/json')
+
+
+def iter_batches(rows):
+    # Each batch of rows is written as one chunk of the response.
+    rows = iter(rows)
+    batch = list(islice(rows, STREAM_BATCH_SIZE))
+
+    while batch:
+        yield batch
+
+        batch = list(islice(rows, STREAM_BATCH_SIZE))
+
+
+def not_modified(etag):
+    response = Response(status=304)
+    response.set_etag(etag, weak=True)
+
+    return response
+
+
+def parse_filters(model, args, filterable):
+    filters = []
+
+    for arg, value in args:
+        key, _, op = arg.partition('__')
+
+        if key not in filterable or (op and op not in FILTER_OPERATORS):
+            abort(400, message=f'El filtro "{arg}" no es válido.')
+        if isinstance(value, (dict, list)):
+            abort(400, message=f'El valor de {arg} debe ser un valor '
+                               f'simple.')
+
+        try:
+            filters.append(model.build_filter(key, op or 'eq', value))
+        except ValueError:
+            abort(400, message=f'El valor "{value}" no es válido para '
+                               f'{arg}.')
+
+    return filters
+
+
+def to_bool(value):
+    # bool() would turn any non empty string, like "false", into True.
+    if isinstance(value, str):
+        value = value.lower()
+
+        if value in ('true', '1'):
+            return True
+        if value in ('false', '0'):
+            return False
+    elif isinstance(value, bool) or value in (0, 1):
+        return bool(value)
+
+    raise ValueError(value)
+
+
+def stream_list(records):
+    # The records are serialized while the response is sent, so only one
+    # batch of them is kept in memory at a time.  Each batch is written
+    # as one chunk of the response.
+    return Response(stream_with_context(dumps_list(iter_batches(records))),
+                    mimetype='application/json')
 
 
 class ResourceMixin(Resource):
-    def get_parser(self):
-        parser = reqparse.RequestParser()
-
-        for key in self.parsed_model['keys']:
-            if key is not 'password_hash':
-                is_required = key not in self.parsed_model['nullable']
-                if key in self.parsed_model['int']:
-                    parser.add_argument(key,
-                                        type=int,
-                                        required=is_required)
-                elif key in self.parsed_model['float']:
-                    parser.add_argument(key,
-                                        type=float,
-                                        required=is_required)
-                elif key in self.parsed_model['bool']:
-                    parser.add_argument(key,
-                                        type=bool,
-                                        required=is_required)
-                else:
-                    parser.add_argument(key,
-                                        type=str,
-                                        required=is_required)
-
-        return parser
+    expandable = ()
+    # Columns that may be used in the filter of a bulk PATCH, besides the
+    # parent key.  They should match the filterable columns of the list.
+    filterable = ()
+    parsed_model = None
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+
+        # The validators only depend on the model, so they are compiled
+        # once when the resource is defined instead of on every request.
+        if cls.parsed_model is not None:
+            cls.validate = staticmethod(compile_validator(cls.parsed_model))
+            cls.validate_changes = staticmethod(
+                compile_validator(cls.parsed_model, partial=True))
+
+    def get_expand(self):
+        expand = request.args.get('expand')
+
+        if not expand:
+            return ()
+
+        keys = expand.split(',')
+
+        for key in keys:
+            if key not in self.expandable:
+                abort(400, message=f'El valor "{key}" no es válido para '
+                                   f'expand.')
+
+        return keys
+
+    def get_filterable(self):
+        # The parent key is filtered by the list endpoints through the id
+        # in the url.
+        if self.model.parent_key:
+            return (self.model.parent_key, *self.filterable)
+
+        return self.filterable
+
+    def parse_changes(self, changes):
+        if not isinstance(changes, dict) or not changes:
+            abort(400, message='Los cambios deben ser un objeto con al menos '
+                               'un campo.')
+
+        for key in changes:
+            if key not in self.parsed_model['keys'] or \
+                    key in ('password', 'password_hash'):
+                abort(400, message=f'El campo "{key}" no es válido.')
+            # Only PUT and the activate endpoint also inactivate the
+            # collections of activation_cascade.
+            if key in self.parsed_model['excluded'] or \
+                    key == 'is_active' and self.model.activation_cascade:
+                abort(400, message=f'El campo "{key}" no se puede '
+                                   f'modificar.')
+
+        return self.validate_changes(changes)
 
     @jwt_required()
     def get(self, _id):
-        record = self.model.find_by_id(_id, current_identity)
+        fields = get_fields(self.model)
+        expand = self.get_expand()
+        depth = get_depth()
+        etag = get_etag(self.model, expand)
 
-        if record:
-            return {'record': record.to_dict()}, 200
+        if request.if_none_match.contains_weak(etag):
+            return not_modified(etag)
+
+        # PostgreSQL can build the whole JSON document of the record, which
+        # is then sent as it is read.
+        if current_app.config['DB_JSON_AGGREGATION'] and \
+                get_mediatype() == 'application/json':
+            document = self.model.find_json_by_id(
+                _id, current_identity, fields, expand, depth)
+
+            if document:
+                response = Response(f'{{"record": {document}}}\n',
+                                    mimetype='application/json')
+                response.set_etag(etag, weak=True)
+
+                return response
+        else:
+            record = self.model.find_by_id(_id, current_identity, fields)
+
+            if record:
+                return {'record': record.to_dict(expand, depth)}, 200, \
+                    {'ETag': quote_etag(etag, weak=True)}
 
         return {'message': 'El registro solicitado no existe.'}, 404
 
     @jwt_required()
     def post(self):
-        parser = self.get_parser()
-        data = parser.parse_args()
+        body = request.get_json(silent=True)
+
+        if isinstance(body, list):
+            return self.post_many(body)
 
-        if self.parsed_model['unique']:
-            for constraint in self.parsed_model['unique']:
-                _filter = {}
-                for key in constraint:
-                    _filter[key] = data[key]
+        data = self.validate(body)
 
-                if self.model.query.filter_by(**_filter).first():
-                    return {'message': f'El valor "{_filter}" viola '
-                                       f'UNIQUE_CONSTRAINT de la tabla'}, 400
+        if not self.model.is_parent_authorized(data, current_identity):
+            return {'message': 'Acceso denegado a crear este recurso.'}, 403
+
+        conflict = self.model.find_unique_conflict(data)
+
+        if conflict:
+            return {'message': f'El valor "{conflict}" viola '
+                               f'UNIQUE_CONSTRAINT de la tabla'}, 400
 
         record = self.model(**data)
 
         try:
-            record.save_to_db()
+            row = record.insert_to_db()
             if 'stgid' in data:
                 return 'ok', 201
             return {
                        'message': 'Registro creado exitosamente.',
-                       'record': self.model.find_by_id(
-                           record.id,
-                           current_identity
-                       ).to_dict()
+                       'record': self.model.row_to_dict(row)
                    }, 201
         except SQLAlchemyError as e:
             return {'message': f'Ocurrió un error al tratar de crear '
                                f'el registro.  Error: "{e}"'}, 500
 
+    def post_many(self, rows):
+        if not rows:
+            return {'message': 'La lista de registros está vacía.'}, 400
+
+        data = []
+        errors = {}
+
+        # Every row is validated before inserting, so either all the rows
+        # are created or none of them.
+        for index, row in enumerate(rows):
+            try:
+                data.append(self.validate(row))
+            except HTTPException as e:
+                errors[index] = e.data['message']
+
+        if not errors:
+            for index in self.model.get_unauthorized_rows(
+                    data, current_identity):
+                errors[index] = 'Acceso denegado a crear este recurso.'
+
+            for index, conflict in self.model.find_unique_conflicts(
+                    data).items():
+                errors.setdefault(index, f'El valor "{conflict}" viola '
+                                         f'UNIQUE_CONSTRAINT de la tabla')
+
+        if errors:
+            return {
+                       'message': 'No se creó ningún registro.',
+                       'errors': [{'index': index, 'message': errors[index]}
+                                  for index in sorted(errors)]
+                   }, 400
+
+        records = [self.model(**item) for item in data]
+
+        try:
+            rows = self.model.insert_many(records)
+            return {
+                       'message': 'Registros creados exitosamente.',
+                       'records': [self.model.row_to_dict(row)
+                                   for row in rows]
+                   }, 201
+        except SQLAlchemyError as e:
+            return {'message': f'Ocurrió un error al tratar de crear '
+                               f'los registros.  Error: "{e}"'}, 500
+
     @jwt_required()
     def put(self, _id):
-        parser = self.get_parser()
-        data = parser.parse_args()
+        data = self.validate(request.get_json(silent=True))
 
-        if self.parsed_model['unique']:
-            for constraint in self.parsed_model['unique']:
-                _filter = {}
-                for key in constraint:
-                    _filter[key] = data[key]
+        conflict = self.model.find_unique_conflict(data, _id)
 
-                if self.model.query.filter_by(**_filter).first() and \
-                        self.model.query.filter_by(**_filter)\
-                        .first().id != _id:
-                    return {'message': f'El valor "{_filter}" viola '
-                                       f'UNIQUE_CONSTRAINT de la tabla'}, 400
+        if conflict:
+            return {'message': f'El valor "{conflict}" viola '
+                               f'UNIQUE_CONSTRAINT de la tabla'}, 400
 
         record = self.model.find_by_id(_id, current_identity)
 
@@ -102,6 +411,107 @@ class ResourceMixin(Resource):
 
         return {'message': 'El registro solicitado no existe.'}, 404
 
+    @jwt_required()
+    def patch(self, _id=None):
+        body = request.get_json(silent=True)
+
+        if _id is not None:
+            return self.patch_one(_id, body)
+
+        if isinstance(body, dict):
+            # The same changes are applied to every record of the
+            # organization matching the filter.
+            if not isinstance(body.get('filter'), dict) or \
+                    not body['filter']:
+                abort(400, message='El filtro no puede estar vacío.')
+
+            changes = self.parse_changes(body.get('changes'))
+            filters = parse_filters(self.model, body['filter'].items(),
+                                    self.get_filterable())
+            updates = {_id: changes for _id in
+                       self.model.find_ids(current_identity, filters)}
+        elif isinstance(body, list) and body:
+            updates = {}
+
+            for item in body:
+                if not isinstance(item, dict) or \
+                        not isinstance(item.get('id'), int):
+                    abort(400, message='Cada elemento debe tener un id y '
+                                       'los cambios del registro.')
+                if item['id'] in updates:
+                    abort(400, message=f'El id "{item["id"]}" está '
+                                       f'repetido.')
+
+                updates[item['id']] = self.parse_changes(item.get('changes'))
+
+            missing = set(updates) - self.model.get_visible_ids(
+                set(updates), current_identity)
+
+            if missing:
+                return {
+                           'message': 'Los registros solicitados no '
+                                      'existen.',
+                           'ids': sorted(missing)
+                       }, 404
+        else:
+            abort(400, message='El cuerpo debe ser una lista de cambios o '
+                               'un filtro con los cambios.')
+
+        ids = list(updates)
+        denied = self.model.get_unauthorized_rows(
+            [updates[_id] for _id in ids], current_identity)
+
+        if denied:
+            return {
+                       'message': 'Acceso denegado a modificar estos '
+                                  'registros.',
+                       'ids': sorted(ids[index] for index in denied)
+                   }, 403
+
+        try:
+            if updates:
+                self.model.update_many(updates)
+            return {
+                       'message': 'Registros actualizados exitosamente.',
+                       'ids': sorted(updates)
+                   }, 200
+        except IntegrityError as e:
+            return {'message': f'Los cambios violan una restricción de la '
+                               f'tabla.  Error: "{e.orig}"'}, 400
+        except SQLAlchemyError as e:
+            return {'message': f'Ocurrió un error al tratar de modificar '
+                               f'los registros.  Error: "{e}"'}, 500
+
+    def patch_one(self, _id, body):
+        changes = self.parse_changes(body)
+        record = self.model.find_by_id(_id, current_identity)
+
+        if not record:
+            return {'message': 'El registro solicitado no existe.'}, 404
+
+        if not self.model.is_parent_authorized(changes, current_identity):
+            return {'message': 'Acceso denegado a modificar este '
+                               'recurso.'}, 403
+
+        if any(key in constraint for constraint in self.parsed_model['unique']
+               for key in changes):
+            conflict = self.model.find_unique_conflict(
+                dict(record.get_column_values(), **changes), _id)
+
+            if conflict:
+                return {'message': f'El valor "{conflict}" viola '
+                                   f'UNIQUE_CONSTRAINT de la tabla'}, 400
+
+        try:
+            record.patch(changes)
+            return {
+                       'message': 'Registro actualizado exitosamente.',
+                       'record': record.to_dict()
+                   }, 200
+        except SQLAlchemyError as e:
+            return {'message': f'Ocurrió un error al tratar de modificar '
+                               f'el registro.  Error: "{e}"'}, 500
+
     @jwt_required()
     def delete(self, _id):
         record = self.model.find_by_id(_id, current_identity)
@@ -118,53 +528,230 @@ class ResourceMixin(Resource):
 
 
 class ActivateMixin(Resource):
-    parser = reqparse.RequestParser()
-    parser.add_argument('is_active',
-                        type=bool,
-                        required=True)
-
     @jwt_required()
-    def put(self, _id):
-        data = self.parser.parse_args()
+    def put(self, _id=None):
+        body = request.get_json(silent=True)
 
-        record = self.model.find_by_id(_id, current_identity)
+        if _id is None:
+            return self.put_many(body)
 
-        if record:
-            if data['is_active']:
-                if not record.is_active:
-                    try:
-                        record.activate()
-                        return {'message': 'El registro fue activado.'}, 200
-                    except SQLAlchemyError as e:
-                        return {'message': f'Ocurrió un error al tratar de '
-                                           f'activar el registro.  Error: '
-                                           f'"{e}"'}, 500
-                else:
-                    return {'message': 'El registro ya estaba activo.'}, 400
-            else:
-                if record.is_active:
-                    try:
-                        record.inactivate()
-                        return {'message': 'El registro fue inactivado.'}, 200
-                    except SQLAlchemyError as e:
-                        return {'message': f'Ocurrió un error al tratar de '
-                                           f'inactivar el registro.  Error: '
-                                           f'"{e}"'}, 500
-                else:
-                    return {'message': 'El registro ya estaba inactivo.'}, 400
+        try:
+            data = {'is_active': to_bool(body['is_active'])}
+        except (KeyError, TypeError, ValueError):
+            abort(400, message={'is_active': 'El valor de is_active debe '
+                                              'ser true o false.'})
 
-        return {'message': 'El registro solicitado no existe.'}, 404
+        # The record is changed as in a bulk request, so its inactivation
+        # also reaches the collections of activation_cascade.
+        try:
+            changed = self.model.set_active([_id], data['is_active'],
+                                            current_identity)
+        except SQLAlchemyError as e:
+            action = 'activar' if data['is_active'] else 'inactivar'
+            return {'message': f'Ocurrió un error al tratar de {action} el '
+                               f'registro.  Error: "{e}"'}, 500
+
+        if changed:
+            return {'message': 'El registro fue activado.'
+                    if data['is_active'] else
+                    'El registro fue inactivado.'}, 200
+
+        if not self.model.get_visible_ids([_id], current_identity):
+            return {'message': 'El registro solicitado no existe.'}, 404
+
+        return {'message': 'El registro ya estaba activo.'
+                if data['is_active'] else
+                'El registro ya estaba inactivo.'}, 400
+
+    def put_many(self, body):
+        try:
+            is_active = to_bool(body['is_active'])
+        except (KeyError, TypeError, ValueError):
+            abort(400, message={'is_active': 'El valor de is_active debe '
+                                              'ser true o false.'})
+
+        column = self.model.get_parent_column()
+
+        if isinstance(body.get('ids'), list) and \
+                all(isinstance(_id, int) for _id in body['ids']):
+            ids = set(body['ids'])
+            missing = ids - self.model.get_visible_ids(ids, current_identity)
+
+            if missing:
+                return {
+                           'message': 'Los registros solicitados no '
+                                      'existen.',
+                           'ids': sorted(missing)
+                       }, 404
+        elif column is not None and isinstance(body.get(column.key), int):
+            # Every record of the parent, e.g. the employees of a
+            # department.
+            ids = set(self.model.find_ids(
+                current_identity,
+                [getattr(self.model, column.key) == body[column.key]]
+            ))
+        else:
+            abort(400, message='Debe enviar la lista de ids de los '
+                               'registros.')
+
+        try:
+            changed = self.model.set_active(ids, is_active,
+                                            current_identity) \
+                if ids else []
+            return {
+                       'message': 'Los registros fueron activados.'
+                       if is_active else
+                       'Los registros fueron inactivados.',
+                       'updated': sorted(changed),
+                       'unchanged': sorted(ids - set(changed))
+                   }, 200
+        except SQLAlchemyError as e:
+            return {'message': f'Ocurrió un error al tratar de modificar '
+                               f'los registros.  Error: "{e}"'}, 500
 
 
 class ListMixin(Resource):
+    # Columns that may be used to filter or sort the list.  Only columns
+    # backed by an index in db/init.sql should be listed here.
+    filterable = ()
+    sortable = ()
+    # Query string arguments that are not filters.
+    reserved_args = ('after', 'depth', 'fields', 'limit', 'sort')
+
+    def encode_cursor(self, record, sort):
+        values = json.dumps(self.model.get_sort_values(record, sort),
+                            default=str)
+
+        return urlsafe_b64encode(values.encode()).decode()
+
+    def decode_cursor(self, cursor, sort):
+        try:
+            values = json.loads(urlsafe_b64decode(cursor.encode()))
+        except (Base64Error, UnicodeError, ValueError):
+            values = None
+
+        if not isinstance(values, list) or \
+                len(values) != len(self.model.get_sort_columns(sort)):
+            abort(400, message=f'El valor "{cursor}" no es válido para '
+                               f'after.')
+
+        return values
+
+    def get_filters(self):
+        args = get_filter_args(self.model, self.reserved_args)
+
+        return parse_filters(self.model, args, self.filterable)
+
+    def get_page(self, sort):
+        limit = request.args.get('limit')
+        after = request.args.get('after')
+
+        if limit is None:
+            if after is not None:
+                abort(400, message='El parámetro after requiere limit.')
+
+            return None, None
+
+        if not limit.isdigit() or int(limit) < 1:
+            abort(400, message=f'El valor "{limit}" no es válido para '
+                               f'limit.')
+
+        return int(limit), self.decode_cursor(after, sort) if after else None
+
+    def get_sort(self):
+        sort = request.args.get('sort')
+
+        if sort and (sort[1:] if sort.startswith('-') else sort) \
+                not in self.sortable:
+            abort(400, message=f'El valor "{sort}" no es válido para sort.')
+
+        return sort
+
     @jwt_required()
     def get(self, _id=None):
-        if _id:
-            _list = self.model.find_all(current_identity, _id)
-        else:
-            _list = self.model.find_all(current_identity)
+        sort = self.get_sort()
+        limit, after = self.get_page(sort)
+        fields = get_fields(self.model)
+        filters = self.get_filters()
+        depth = get_depth()
+        etag = get_etag(self.model)
+
+        if request.if_none_match.contains_weak(etag):
+            return not_modified(etag)
+
+        headers = {'ETag': quote_etag(etag, weak=True)}
+
+        # An empty list is only an error when the whole list was requested,
+        # not when the filters or the cursor leave no records.
+        if limit is None:
+            rows = iter(self.model.find_all(current_identity, _id, fields,
+                                            filters, sort))
+            first = next(rows, None)
+
+            # Only JSON can be written before the number of records is
+            # known, other representations receive the whole list.
+            if first is not None:
+                records = self.model.iter_dicts(chain((first,), rows),
+                                                fields, depth)
+
+                if get_mediatype() == 'application/json':
+                    response = stream_list(records)
+                    response.headers.extend(headers)
+
+                    return response
+
+                return {'list': list(records)}, 200, headers
+
+            if filters:
+                return {'list': []}, 200, headers
+
+            return {'message': 'Acceso denegado a listar este recurso.'}, 403
 
-        if _list:
-            return {'list': list(map(lambda x: x.to_dict(), _list))}
+        # Fetch one record more than requested to know if there is a next
+        # page without running a second query.
+        _list = self.model.find_page(current_identity, limit + 1, after, _id,
+                                     fields, filters, sort)
+
+        if _list or after or filters:
+            page = _list[:limit]
+
+            return {
+                'list': self.model.rows_to_dicts(page, fields, depth),
+                'next': self.encode_cursor(page[-1], sort)
+                if len(_list) > limit else None
+            }, 200, headers
 
         return {'message': 'Acceso denegado a listar este recurso.'}, 403
+
+
+class ExportMixin(Resource):
+    filterable = ()
+    formats = {
+        'csv': (generate_csv, 'text/csv'),
+        'ndjson': (generate_ndjson, 'application/x-ndjson')
+    }
+
+    @jwt_required()
+    def get(self):
+        export_format = request.args.get('format', 'csv')
+
+        if export_format not in self.formats:
+            abort(400, message=f'El valor "{export_format}" no es válido '
+                               f'para format.')
+
+        args = get_filter_args(self.model)
+        filters = parse_filters(self.model, args, self.filterable)
+
+        # The rows of all the organization are sent while they are read
+        # from the database, so the export does not depend on its size.
+        rows = iter(self.model.export_rows(current_identity, filters))
+        generate, mimetype = self.formats[export_format]
+        chunks = generate(self.model.__table__.columns.keys(), rows)
+        headers = {
+            'Content-Disposition': f'attachment; filename='
+                                   f'{self.model.__tablename__}.'
+                                   f'{export_format}'
+        }
+
+        return Response(stream_with_context(chunks), mimetype=mimetype,
+                        headers=headers)
@@ -1,15 +1,42 @@
 from models.organization import OrganizationModel
 from resources.mixin import ActivateMixin, ListMixin, ResourceMixin
+from security import invalidate_token_version
 
 
 class Organization(ResourceMixin):
     model = OrganizationModel
     parsed_model = model.parse_model()
 
+    # The users of an organization are rejected while it is inactive, so
+    # the cached token versions are dropped after every change to it.
+    def put(self, _id):
+        response = super().put(_id)
+        invalidate_token_version()
+
+        return response
+
+    def patch(self, _id=None):
+        response = super().patch(_id)
+        invalidate_token_version()
+
+        return response
+
+    def delete(self, _id):
+        response = super().delete(_id)
+        invalidate_token_version()
+
+        return response
+
 
 class ActivateOrganization(ActivateMixin):
     model = OrganizationModel
 
+    def put(self, _id=None):
+        response = super().put(_id)
+        invalidate_token_version()
+
+        return response
+
 
 class Organizations(ListMixin):
     model = OrganizationModel
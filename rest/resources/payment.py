@@ -1,11 +1,19 @@
 from models.payment import PaymentModel
-from resources.mixin import ListMixin, ResourceMixin
+from resources.mixin import ExportMixin, ListMixin, ResourceMixin
 
 
 class Payment(ResourceMixin):
     model = PaymentModel
     parsed_model = model.parse_model()
+    filterable = ('payment_date',)
 
 
 class Payments(ListMixin):
     model = PaymentModel
+    filterable = ('payment_date',)
+    sortable = ('payment_date',)
+
+
+class ExportPayments(ExportMixin):
+    model = PaymentModel
+    filterable = ('payment_date',)
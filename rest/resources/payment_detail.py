@@ -1,5 +1,5 @@
 from models.payment_detail import PaymentDetailModel
-from resources.mixin import ListMixin, ResourceMixin
+from resources.mixin import ExportMixin, ListMixin, ResourceMixin
 
 
 class PaymentDetail(ResourceMixin):
@@ -9,3 +9,7 @@ class PaymentDetail(ResourceMixin):
 
 class PaymentDetails(ListMixin):
     model = PaymentDetailModel
+
+
+class ExportPaymentDetails(ExportMixin):
+    model = PaymentDetailModel
@@ -1,9 +1,9 @@
 from flask import current_app, make_response
-from flask_jwt import current_identity, jwt_required
 from flask_restful import reqparse, Resource
 from sqlalchemy.exc import SQLAlchemyError
 
 from models.raw_attendance import RawAttendanceModel
+from resources.mixin import ListMixin
 
 
 class RawAttendance(Resource):
@@ -46,12 +46,6 @@ class RawAttendance(Resource):
         return 'Token incorrecto.', 401, {'Content-Type': 'application/text'}
 
 
-class RawAttendances(Resource):
-    @jwt_required()
-    def get(self):
-        _list = RawAttendanceModel.find_all(current_identity)
-
-        if _list:
-            return {'list': list(map(lambda x: x.to_dict(), _list))}
-
-        return {'message': 'Acceso denegado a listar este recurso.'}, 403
+class RawAttendances(ListMixin):
+    model = RawAttendanceModel
+    filterable = ('userid',)
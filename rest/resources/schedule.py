@@ -5,7 +5,10 @@ from resources.mixin import ListMixin, ResourceMixin
 class Schedule(ResourceMixin):
     model = ScheduleModel
     parsed_model = model.parse_model()
+    filterable = ('start_date',)
 
 
 class Schedules(ListMixin):
     model = ScheduleModel
+    filterable = ('start_date',)
+    sortable = ('start_date',)
@@ -5,7 +5,9 @@ from resources.mixin import ListMixin, ResourceMixin
 class ScheduleDetail(ResourceMixin):
     model = ScheduleDetailModel
     parsed_model = model.parse_model()
+    filterable = ('employee_id',)
 
 
 class ScheduleDetails(ListMixin):
     model = ScheduleDetailModel
+    filterable = ('employee_id',)
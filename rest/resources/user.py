@@ -1,15 +1,42 @@
 from models.user import AppUserModel
 from resources.mixin import ActivateMixin, ListMixin, ResourceMixin
+from security import invalidate_token_version
 
 
 class User(ResourceMixin):
     model = AppUserModel
     parsed_model = model.parse_model()
 
+    # The cached token versions are dropped after every change to the
+    # users, so the next request reads the version from the database.
+    def put(self, _id):
+        response = super().put(_id)
+        invalidate_token_version(_id)
+
+        return response
+
+    def patch(self, _id=None):
+        response = super().patch(_id)
+        invalidate_token_version(_id)
+
+        return response
+
+    def delete(self, _id):
+        response = super().delete(_id)
+        invalidate_token_version(_id)
+
+        return response
+
 
 class ActivateUser(ActivateMixin):
     model = AppUserModel
 
+    def put(self, _id=None):
+        response = super().put(_id)
+        invalidate_token_version(_id)
+
+        return response
+
 
 class Users(ListMixin):
     model = AppUserModel
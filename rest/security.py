@@ -1,6 +1,20 @@
+from collections import namedtuple, OrderedDict
 from datetime import datetime
+from threading import Lock
+from time import monotonic
+
+from flask import current_app
+
 from models.user import AppUserModel
 
+# The user of a request, built from the claims of its token.
+Identity = namedtuple('Identity', 'id organization_id is_super')
+
+# Token versions by user id with the time they expire, the least recently
+# used first.
+_token_versions = OrderedDict()
+_token_versions_lock = Lock()
+
 
 def authenticate(username, password):
     user = AppUserModel.find_by_username(username)
@@ -14,5 +28,86 @@ def authenticate(username, password):
         return user
 
 
+def get_token_version(_id):
+    """
+    Return the current token version of a user, cached for
+    IDENTITY_CACHE_TTL seconds.
+
+    :param _id: The id of the user
+    :type _id: int
+    :return: The token version, or None if the user does not exist
+    :rtype: int
+    """
+    now = monotonic()
+
+    with _token_versions_lock:
+        cached = _token_versions.get(_id)
+
+        if cached and cached[0] > now:
+            _token_versions.move_to_end(_id)
+
+            return cached[1]
+
+    version = AppUserModel.find_token_version(_id)
+
+    with _token_versions_lock:
+        _token_versions[_id] = (now + current_app.config['IDENTITY_CACHE_TTL'],
+                                version)
+        _token_versions.move_to_end(_id)
+
+        while len(_token_versions) > \
+                current_app.config['IDENTITY_CACHE_SIZE']:
+            _token_versions.popitem(last=False)
+
+    return version
+
+
 def identity(payload):
-    return AppUserModel.find_by_id(payload['identity'])
+    version = get_token_version(payload['identity'])
+
+    # Tokens issued before the user was inactivated or its organization,
+    # permissions or password changed have an older version.
+    if version is None or version != payload.get('token_version'):
+        return None
+
+    return Identity(payload['identity'], payload['organization_id'],
+                    payload['is_super'])
+
+
+def invalidate_token_version(_id=None):
+    """
+    Remove the cached token version of a user, or of all users without
+    an id.
+
+    :param _id: The id of the user that was modified
+    :type _id: int
+    """
+    with _token_versions_lock:
+        if _id is None:
+            _token_versions.clear()
+        else:
+            _token_versions.pop(_id, None)
+
+
+def payload_handler(user):
+    """
+    Make the claims of the token of an authenticated user.
+
+    The organization and permissions of the user are signed in the token,
+    so requests can be scoped without reading the user.
+
+    :param user: The authenticated user
+    :return: The claims of the token
+    :rtype: dict
+    """
+    now = datetime.utcnow()
+
+    return {
+        'iat': now,
+        'nbf': now + current_app.config['JWT_NOT_BEFORE_DELTA'],
+        'exp': now + current_app.config['JWT_EXPIRATION_DELTA'],
+        'identity': user.id,
+        'organization_id': user.organization_id,
+        'is_super': user.is_super,
+        'token_version': user.token_version
+    }
@@ -1,4 +1,5 @@
 import json
+import os
 
 from unittest import TestCase
 from werkzeug.security import check_password_hash
@@ -33,6 +34,11 @@ from models.user import AppUserModel
 
 app = create_app('testing')
 
+# The triggers and functions of db/init.sql that db.create_all() does not
+# create, applied to the test database by the migrations.
+MIGRATIONS_PATH = os.path.join(os.path.dirname(__file__), '..', '..', 'db',
+                               'migrations')
+
 
 # noinspection PyTypeChecker
 class BaseTest(TestCase):
@@ -40,11 +46,26 @@ class BaseTest(TestCase):
     @classmethod
     def setUpClass(cls):
         """
-        Register the flask_sqlalchemy extension at
-        the beginning of the test suite.
+        Register the flask_sqlalchemy extension and create the tables
+        and triggers at the beginning of the test suite.
         """
         with app.app_context():
             db.init_app(app)
+            db.create_all()
+
+            # The scripts are run by the driver as they are, without the
+            # parsing of bind parameters of SQLAlchemy.
+            connection = db.engine.raw_connection()
+
+            try:
+                with connection.cursor() as cursor:
+                    for name in sorted(os.listdir(MIGRATIONS_PATH)):
+                        with open(os.path.join(MIGRATIONS_PATH, name)) as f:
+                            cursor.execute(f.read())
+
+                connection.commit()
+            finally:
+                connection.close()
 
     def setUp(self):
         """Create all db tables before each test."""
@@ -1,11 +1,22 @@
+import csv
+import gzip
 import json
+import zlib
 from copy import deepcopy
+from io import StringIO
 
+import msgpack
 from flask import current_app
+from sqlalchemy import event
 
+from db import db
+from models.organization import OrganizationModel
+from models.user import AppUserModel
+from security import invalidate_token_version
 from tests.base_test import BaseTest
 from tests.business_objects import get_sys_test_params, get_item_from_db, \
-    OBJECTS_TO_TEST, RAW_ATTENDANCE
+    solve_obj_dependencies, ATTENDANCE, BANK_ACCOUNT, DEPARTMENT, EMPLOYEE, \
+    OBJECTS_TO_TEST, PAYMENT, PAYMENT_DETAIL, RAW_ATTENDANCE, USER
 
 
 class TestResources(BaseTest):
@@ -86,6 +97,91 @@ class TestResources(BaseTest):
                             self.clear_db()
                             get_item_from_db.cache_clear()
 
+    def test_post_many(self):
+        """
+        Test that POST requests with a list of records to a resource's
+        endpoint create all of them or, if one is not valid, none.
+        """
+        with self.client() as c:
+            with self.app_context():
+                for obj in OBJECTS_TO_TEST:
+                    resource, model, post_items, _, endpoints, \
+                        user = get_sys_test_params(obj, 0, 'all')
+
+                    parsed_model = model.parse_model()
+
+                    if endpoints[0]:
+                        # The first two items belong to the organization
+                        # of the user.
+                        post_items = post_items[:2]
+
+                        with self.subTest(resource, post_items=post_items,
+                                          user=user):
+                            count = model.query.count()
+
+                            result = c.post(f'/{endpoints[0]}',
+                                            data=json.dumps(
+                                                post_items + [{}]),
+                                            headers=self.get_headers(user))
+
+                            self.assertEqual(400, result.status_code)
+                            self.assertEqual(
+                                [len(post_items)],
+                                [x['index'] for x in
+                                 json.loads(result.data)['errors']])
+                            self.assertEqual(count, model.query.count())
+
+                            result = c.post(f'/{endpoints[0]}',
+                                            data=json.dumps(post_items),
+                                            headers=self.get_headers(user))
+
+                            records = json.loads(result.data)['records']
+
+                            self.assertEqual(201, result.status_code)
+                            self.assertEqual(len(post_items), len(records))
+
+                            for item, record in zip(post_items, records):
+                                self.check_record(item, record, parsed_model)
+
+                            if parsed_model['unique']:
+                                result = c.post(f'/{endpoints[0]}',
+                                                data=json.dumps(post_items),
+                                                headers=self.get_headers(
+                                                    user))
+
+                                self.assertEqual(400, result.status_code)
+
+                            self.clear_db()
+                            get_item_from_db.cache_clear()
+
+    def test_post_other_organization(self):
+        """
+        Test that POST requests to a resource's endpoint return status
+        code 403 if the parent record belongs to another organization.
+        """
+        with self.client() as c:
+            with self.app_context():
+                for obj in OBJECTS_TO_TEST:
+                    resource, model, post_items, _, endpoints, \
+                        user = get_sys_test_params(obj, 0, 'first')
+
+                    if endpoints[0] and obj['user_type'] == 'test_0':
+                        item = post_items[0]
+
+                        with self.subTest(resource, item=item, user=user):
+                            other_user = get_sys_test_params(
+                                obj, 0, user_type='test_1')[5]
+
+                            result = c.post(f'/{endpoints[0]}',
+                                            data=json.dumps(item),
+                                            headers=self.get_headers(
+                                                other_user))
+
+                            self.assertEqual(403, result.status_code)
+
+                            self.clear_db()
+                            get_item_from_db.cache_clear()
+
     def test_post_not_unique(self):
         """
         Test that POST requests to a resource's endpoint return
@@ -127,6 +223,69 @@ class TestResources(BaseTest):
                             self.clear_db()
                             get_item_from_db.cache_clear()
 
+    def test_post_many_not_unique(self):
+        """
+        Test that POST requests with a list of records report the rows
+        violating a UNIQUE constraint whatever the format of their values.
+        """
+        with self.client() as c:
+            with self.app_context():
+                get_item_from_db.cache_clear()
+                _, _, post_items, _, endpoints, \
+                    user = get_sys_test_params(ATTENDANCE, 0, 'all')
+
+                headers = self.get_headers(user)
+                c.post(f'/{endpoints[0]}', data=json.dumps(post_items[0]),
+                       headers=headers)
+
+                result = c.post(f'/{endpoints[0]}', data=json.dumps([
+                    dict(post_items[0], work_day='2018-1-1'), post_items[1]
+                ]), headers=headers)
+
+                self.assertEqual(400, result.status_code)
+                self.assertEqual([0], [x['index'] for x in
+                                       json.loads(result.data)['errors']])
+
+                self.clear_db()
+                get_item_from_db.cache_clear()
+
+    def test_post_invalid_fields(self):
+        """
+        Test that POST requests to a resource's endpoint validate the
+        fields of the record.
+        """
+        with self.client() as c:
+            with self.app_context():
+                get_item_from_db.cache_clear()
+                _, _, post_items, _, endpoints, \
+                    user = get_sys_test_params(BANK_ACCOUNT, 0, 'first')
+
+                item = post_items[0]
+                headers = self.get_headers(user)
+
+                for invalid in [{'account_type2': 'Ahorro'},
+                                {'bank_id': 'abc'},
+                                {'account_number': None},
+                                {'is_active': 'no'}]:
+                    with self.subTest(invalid=invalid):
+                        result = c.post(f'/{endpoints[0]}',
+                                        data=json.dumps({**item, **invalid}),
+                                        headers=headers)
+
+                        self.assertEqual(400, result.status_code)
+
+                result = c.post(f'/{endpoints[0]}',
+                                data=json.dumps(dict(item,
+                                                     is_active='false')),
+                                headers=headers)
+                record = json.loads(result.data)['record']
+
+                self.assertEqual(201, result.status_code)
+                self.assertFalse(record['is_active'])
+
+                self.clear_db()
+                get_item_from_db.cache_clear()
+
     def test_get_with_authentication(self):
         """
         Test that GET requests to a resource's endpoint return
@@ -163,6 +322,290 @@ class TestResources(BaseTest):
                             self.clear_db()
                             get_item_from_db.cache_clear()
 
+    def test_get_with_db_json(self):
+        """
+        Test that GET requests return the same record when PostgreSQL
+        builds the JSON document.
+        """
+        with self.client() as c:
+            with self.app_context():
+                for obj in OBJECTS_TO_TEST:
+                    resource, model, post_items, _, endpoints, \
+                        user = get_sys_test_params(obj, 0, 'first')
+
+                    if endpoints[0]:
+                        item = post_items[0]
+
+                        with self.subTest(resource, item=item, user=user):
+                            headers = self.get_headers(user)
+                            result = c.post(f'/{endpoints[0]}',
+                                            data=json.dumps(item),
+                                            headers=headers)
+                            record = json.loads(result.data)['record']
+                            urls = [f'/{endpoints[0]}/{record["id"]}']
+
+                            # Also check a record with a nested collection.
+                            if obj is PAYMENT_DETAIL:
+                                urls.append(f'/payment/{record["payment_id"]}')
+
+                            for url in urls:
+                                for query in ['', '?depth=0', '?fields=id']:
+                                    expected = c.get(f'{url}{query}',
+                                                     headers=headers)
+
+                                    current_app.config[
+                                        'DB_JSON_AGGREGATION'] = True
+                                    result = c.get(f'{url}{query}',
+                                                   headers=headers)
+                                    current_app.config[
+                                        'DB_JSON_AGGREGATION'] = False
+
+                                    self.assertEqual(200, result.status_code)
+                                    self.assertEqual(
+                                        json.loads(expected.data),
+                                        json.loads(result.data))
+
+                            self.clear_db()
+                            get_item_from_db.cache_clear()
+
+    def test_get_with_expand(self):
+        """
+        Test that GET requests to a resource's endpoint only include the
+        relationships requested in the expand parameter.
+        """
+        with self.client() as c:
+            with self.app_context():
+                _, _, post_items, _, endpoints, \
+                    user = get_sys_test_params(PAYMENT, 0, 'first')
+
+                item = post_items[0]
+                headers = self.get_headers(user)
+
+                c.post(f'/{endpoints[0]}',
+                       data=json.dumps(item),
+                       headers=headers)
+
+                result = c.get(f'/employee/{item["employee_id"]}',
+                               headers=headers)
+
+                self.assertEqual(200, result.status_code)
+                self.assertNotIn('payments',
+                                 json.loads(result.data)['record'])
+
+                result = c.get(f'/employee/{item["employee_id"]}'
+                               f'?expand=payments',
+                               headers=headers)
+
+                record = json.loads(result.data)['record']
+
+                self.assertEqual(200, result.status_code)
+                self.assertEqual(1, len(record['payments']))
+                self.assertNotIn('attendances', record)
+
+                result = c.get(f'/employee/{item["employee_id"]}'
+                               f'?expand=department',
+                               headers=headers)
+
+                self.assertEqual(400, result.status_code)
+
+                self.clear_db()
+                get_item_from_db.cache_clear()
+
+    def test_get_without_collections(self):
+        """
+        Test that the records of departments, positions and shifts do not
+        include their employees, which are listed by /employees.
+        """
+        with self.client() as c:
+            with self.app_context():
+                get_item_from_db.cache_clear()
+                _, _, post_items, _, endpoints, \
+                    user = get_sys_test_params(EMPLOYEE, 0, 'first')
+
+                item = post_items[0]
+                headers = self.get_headers(user)
+
+                c.post(f'/{endpoints[0]}', data=json.dumps(item),
+                       headers=headers)
+
+                for key, endpoint in [('department_id', 'department'),
+                                      ('position_id', 'employment_position'),
+                                      ('shift_id', 'shift')]:
+                    with self.subTest(endpoint=endpoint):
+                        result = c.get(f'/{endpoint}/{item[key]}',
+                                       headers=headers)
+
+                        self.assertEqual(200, result.status_code)
+                        self.assertNotIn('employees',
+                                         json.loads(result.data)['record'])
+
+                        result = c.get(f'/{endpoint}s', headers=headers)
+
+                        self.assertEqual(200, result.status_code)
+                        self.assertFalse(any(
+                            'employees' in record
+                            for record in json.loads(result.data)['list']))
+
+                self.clear_db()
+                get_item_from_db.cache_clear()
+
+    def test_get_with_msgpack(self):
+        """
+        Test that GET requests that accept MessagePack receive the same
+        values as the JSON responses.
+        """
+        with self.client() as c:
+            with self.app_context():
+                _, _, post_items, _, endpoints, \
+                    user = get_sys_test_params(PAYMENT, 0, 'first')
+
+                headers = self.get_headers(user)
+                record = json.loads(c.post(f'/{endpoints[0]}',
+                                           data=json.dumps(post_items[0]),
+                                           headers=headers).data)['record']
+
+                for url in [f'/{endpoints[0]}/{record["id"]}', '/countries']:
+                    with self.subTest(url=url):
+                        result = c.get(url, headers=headers)
+                        packed = c.get(url, headers={
+                            **headers, 'Accept': 'application/msgpack'})
+
+                        self.assertEqual(200, packed.status_code)
+                        self.assertEqual('application/msgpack',
+                                         packed.content_type)
+                        self.assertEqual(json.loads(result.data),
+                                         msgpack.unpackb(packed.data,
+                                                         raw=False))
+                        self.assertIn('Accept', result.vary)
+                        self.assertIn('Accept', packed.vary)
+
+                self.clear_db()
+                get_item_from_db.cache_clear()
+
+    def test_get_not_modified(self):
+        """
+        Test that GET requests with the ETag of the last response return
+        status code 304 until the resource changes.
+        """
+        with self.client() as c:
+            with self.app_context():
+                get_item_from_db.cache_clear()
+                _, _, post_items, _, endpoints, \
+                    user = get_sys_test_params(PAYMENT, 2, 'all')
+
+                headers = self.get_headers(user)
+                record = json.loads(c.post(f'/{endpoints[0]}',
+                                           data=json.dumps(post_items[0]),
+                                           headers=headers).data)['record']
+
+                for url in [f'/{endpoints[0]}/{record["id"]}',
+                            f'/{endpoints[2]}/{record["employee_id"]}',
+                            f'/{endpoints[2]}/{record["employee_id"]}'
+                            f'?limit=1']:
+                    with self.subTest(url=url):
+                        etag = c.get(url, headers=headers).headers['ETag']
+                        result = c.get(url, headers={
+                            **headers, 'If-None-Match': etag})
+
+                        self.assertEqual(304, result.status_code)
+                        self.assertEqual(etag, result.headers['ETag'])
+
+                # Changes of another organization keep the tag.
+                other_user = get_sys_test_params(DEPARTMENT, 0, 'none',
+                                                 user_type='test_1')[5]
+                result = c.post('/department', data=json.dumps(
+                    solve_obj_dependencies(DEPARTMENT['post_objects'][2])),
+                    headers=self.get_headers(other_user))
+
+                self.assertEqual(201, result.status_code)
+                self.assertEqual(304, c.get(url, headers={
+                    **headers, 'If-None-Match': etag}).status_code)
+
+                # The raw attendances are scoped by the organization of the
+                # employee of the clock.
+                other_url = f'/raw_attendances?userid={record["employee_id"]}'
+                other_headers = self.get_headers(other_user)
+                other_etag = c.get(other_url,
+                                   headers=other_headers).headers['ETag']
+                item = dict(RAW_ATTENDANCE['post_objects'][0],
+                            userid=record['employee_id'])
+                item['auth_token'] = current_app.config[
+                    'CLOCK_SECRETS'][item['stgid']]
+                result = c.post('/raw_attendance', data=json.dumps(item),
+                                headers={'Content-Type': 'application/json'})
+
+                self.assertEqual(200, result.status_code)
+                self.assertEqual(304, c.get(other_url, headers={
+                    **other_headers, 'If-None-Match': other_etag
+                }).status_code)
+
+                c.post(f'/{endpoints[0]}',
+                       data=json.dumps(post_items[1]),
+                       headers=headers)
+
+                url = f'/{endpoints[2]}/{record["employee_id"]}'
+                result = c.get(url, headers={**headers,
+                                             'If-None-Match': etag})
+
+                self.assertEqual(200, result.status_code)
+                self.assertNotEqual(etag, result.headers['ETag'])
+
+                self.clear_db()
+                get_item_from_db.cache_clear()
+
+    def test_get_with_fields(self):
+        """
+        Test that GET requests to a resource's endpoint only include the
+        columns requested in the fields parameter.
+        """
+        with self.client() as c:
+            with self.app_context():
+                _, _, post_items, _, endpoints, \
+                    user = get_sys_test_params(PAYMENT, 0, 'first')
+
+                item = post_items[0]
+                headers = self.get_headers(user)
+
+                payment = json.loads(c.post(f'/{endpoints[0]}',
+                                            data=json.dumps(item),
+                                            headers=headers).data)['record']
+
+                result = c.get(f'/employee/{item["employee_id"]}'
+                               f'?fields=first_name,first_surname',
+                               headers=headers)
+
+                self.assertEqual(200, result.status_code)
+                self.assertEqual({'id', 'first_name', 'first_surname'},
+                                 set(json.loads(result.data)['record']))
+
+                result = c.get('/employees?fields=first_name',
+                               headers=headers)
+
+                self.assertEqual(200, result.status_code)
+                for record in json.loads(result.data)['list']:
+                    self.assertEqual({'id', 'first_name'}, set(record))
+
+                result = c.get(f'/employee/{item["employee_id"]}'
+                               f'?fields=payments',
+                               headers=headers)
+
+                self.assertEqual(400, result.status_code)
+
+                result = c.get(f'/{endpoints[0]}/{payment["id"]}?depth=0',
+                               headers=headers)
+
+                self.assertEqual(200, result.status_code)
+                self.assertNotIn('payment_details',
+                                 json.loads(result.data)['record'])
+
+                result = c.get(f'/{endpoints[0]}/{payment["id"]}?depth=a',
+                               headers=headers)
+
+                self.assertEqual(400, result.status_code)
+
+                self.clear_db()
+                get_item_from_db.cache_clear()
+
     def test_get_without_authentication(self):
         """
         Test that GET requests to a resource's endpoint return
@@ -206,6 +649,38 @@ class TestResources(BaseTest):
                             self.clear_db()
                             get_item_from_db.cache_clear()
 
+    def test_get_other_organization(self):
+        """
+        Test that GET requests to a resource's endpoint return status
+        code 404 if the record belongs to another organization.
+        """
+        with self.client() as c:
+            with self.app_context():
+                for obj in OBJECTS_TO_TEST:
+                    resource, model, post_items, _, endpoints, \
+                        user = get_sys_test_params(obj, 0, 'first')
+
+                    if endpoints[0] and obj['user_type'] == 'test_0':
+                        item = post_items[0]
+
+                        with self.subTest(resource, item=item, user=user):
+                            result = c.post(f'/{endpoints[0]}',
+                                            data=json.dumps(item),
+                                            headers=self.get_headers(user))
+                            _id = json.loads(result.data)['record']['id']
+
+                            other_user = get_sys_test_params(
+                                obj, 0, user_type='test_1')[5]
+
+                            result = c.get(f'/{endpoints[0]}/{_id}',
+                                           headers=self.get_headers(
+                                               other_user))
+
+                            self.assertEqual(404, result.status_code)
+
+                            self.clear_db()
+                            get_item_from_db.cache_clear()
+
     def test_put_with_authentication(self):
         """
         Test that PUT requests to a resource's endpoint return
@@ -248,6 +723,35 @@ class TestResources(BaseTest):
                                 self.clear_db()
                                 get_item_from_db.cache_clear()
 
+    def test_put_received_record(self):
+        """
+        Test that a record can be sent back to the resource's endpoint as
+        it was received, including its read-only fields and collections.
+        """
+        with self.client() as c:
+            with self.app_context():
+                get_item_from_db.cache_clear()
+                _, _, post_items, _, endpoints, \
+                    user = get_sys_test_params(PAYMENT, 0, 'first')
+
+                headers = self.get_headers(user)
+                record = json.loads(c.post(f'/{endpoints[0]}',
+                                           data=json.dumps(post_items[0]),
+                                           headers=headers).data)['record']
+                url = f'/{endpoints[0]}/{record["id"]}'
+                record = json.loads(c.get(url, headers=headers).data)[
+                    'record']
+
+                self.assertIn('payment_details', record)
+
+                result = c.put(url, data=json.dumps(record),
+                               headers=headers)
+
+                self.assertEqual(200, result.status_code)
+
+                self.clear_db()
+                get_item_from_db.cache_clear()
+
     def test_put_without_authentication(self):
         """
         Test that PUT requests to a resource's endpoint return
@@ -313,6 +817,220 @@ class TestResources(BaseTest):
                             self.clear_db()
                             get_item_from_db.cache_clear()
 
+    def test_patch_with_authentication(self):
+        """
+        Test that PATCH requests to a resource's endpoint return status
+        code 200 and the record with only the sent fields modified.
+        """
+        with self.client() as c:
+            with self.app_context():
+                for obj in OBJECTS_TO_TEST:
+                    resource, model, post_items, put_items, endpoints, \
+                        user = get_sys_test_params(obj, 0, 'first', 'first')
+
+                    parsed_model = model.parse_model()
+
+                    if endpoints[0]:
+                        item = post_items[0]
+                        mod_item = {k: v for k, v in put_items[0].items()
+                                    if k not in parsed_model['excluded'] and
+                                    k not in ('password', 'password_hash')
+                                    and not (k == 'is_active' and
+                                             model.activation_cascade)}
+
+                        with self.subTest(resource, item=item,
+                                          mod_item=mod_item, user=user):
+                            result = c.post(f'/{endpoints[0]}',
+                                            data=json.dumps(item),
+                                            headers=self.get_headers(user))
+                            original = json.loads(result.data)['record']
+
+                            for _ in range(2):
+                                # The second request does not change any
+                                # value of the record.
+                                result = c.patch(
+                                    f'/{endpoints[0]}/{original["id"]}',
+                                    data=json.dumps(mod_item),
+                                    headers=self.get_headers(user))
+
+                                record = json.loads(result.data)['record']
+
+                                self.assertEqual(200, result.status_code)
+
+                                for k in original:
+                                    if k in parsed_model['float'] and \
+                                            k in mod_item:
+                                        self.assertEqual(float(mod_item[k]),
+                                                         float(record[k]))
+                                    elif k in mod_item:
+                                        self.compare_item(mod_item[k],
+                                                          record[k])
+                                    elif k not in ('current_login',
+                                                   'last_login',
+                                                   'login_count'):
+                                        self.assertEqual(original[k],
+                                                         record[k])
+
+                            result = c.patch(
+                                f'/{endpoints[0]}/{original["id"]}',
+                                data=json.dumps({}),
+                                headers=self.get_headers(user))
+
+                            self.assertEqual(400, result.status_code)
+
+                            self.clear_db()
+                            get_item_from_db.cache_clear()
+
+    def test_patch_many(self):
+        """
+        Test that PATCH requests to a resource's endpoint update every
+        record of the list or matching the filter.
+        """
+        with self.client() as c:
+            with self.app_context():
+                _, _, post_items, _, endpoints, \
+                    user = get_sys_test_params(PAYMENT, 0, 'all')
+
+                headers = self.get_headers(user)
+
+                result = c.post(f'/{endpoints[0]}',
+                                data=json.dumps(post_items),
+                                headers=headers)
+                ids = [x['id'] for x in json.loads(result.data)['records']]
+
+                result = c.patch(f'/{endpoints[0]}',
+                                 data=json.dumps([
+                                     {'id': ids[0],
+                                      'changes': {'document_number': 'a'}},
+                                     {'id': ids[1],
+                                      'changes': {'document_number': 'b',
+                                                  'payment_date':
+                                                      '2018-03-01'}}
+                                 ]),
+                                 headers=headers)
+
+                self.assertEqual(200, result.status_code)
+                self.assertEqual(ids, json.loads(result.data)['ids'])
+
+                records = [json.loads(c.get(f'/{endpoints[0]}/{_id}',
+                                            headers=headers).data)['record']
+                           for _id in ids]
+
+                self.assertEqual(['a', 'b'],
+                                 [x['document_number'] for x in records])
+                self.assertEqual(['2018-01-01', '2018-03-01'],
+                                 [x['payment_date'] for x in records])
+
+                result = c.patch(f'/{endpoints[0]}',
+                                 data=json.dumps({
+                                     'filter': {'employee_id':
+                                                post_items[0]['employee_id']},
+                                     'changes': {'document_number': 'c'}
+                                 }),
+                                 headers=headers)
+
+                self.assertEqual(200, result.status_code)
+                self.assertEqual(ids, json.loads(result.data)['ids'])
+
+                result = c.patch(f'/{endpoints[0]}/{ids[0]}',
+                                 data=json.dumps({'document_number': 'd'}),
+                                 headers=headers)
+
+                self.assertEqual(200, result.status_code)
+
+                records = [json.loads(c.get(f'/{endpoints[0]}/{_id}',
+                                            headers=headers).data)['record']
+                           for _id in ids]
+
+                self.assertEqual(['d', 'c'],
+                                 [x['document_number'] for x in records])
+
+                other_user = get_sys_test_params(PAYMENT, 0,
+                                                 user_type='test_1')[5]
+
+                for body, patch_user, status in [
+                    ([{'id': ids[0], 'changes': {'employee_id': 1}}],
+                     user, 400),
+                    ([{'id': ids[0], 'changes': {'foo': 1}}], user, 400),
+                    ([{'id': 999, 'changes': {'document_number': 'e'}}],
+                     user, 404),
+                    ([{'id': ids[0], 'changes': {'document_number': 'e'}}],
+                     other_user, 404),
+                    ({'filter': {}, 'changes': {'document_number': 'e'}},
+                     user, 400),
+                    ({'filter': {'document_number': 'c'},
+                      'changes': {'document_number': 'e'}}, user, 400),
+                    ({'filter': {'employee_id': [1]},
+                      'changes': {'document_number': 'e'}}, user, 400),
+                    ({'filter': {'payment_date': 1},
+                      'changes': {'document_number': 'e'}}, user, 400),
+                    ([{'id': ids[0], 'changes': {'payment_date': None}}],
+                     user, 400)
+                ]:
+                    with self.subTest(body=body, user=patch_user):
+                        result = c.patch(f'/{endpoints[0]}',
+                                         data=json.dumps(body),
+                                         headers=self.get_headers(
+                                             patch_user))
+
+                        self.assertEqual(status, result.status_code)
+
+                result = c.patch(f'/{endpoints[0]}/{ids[0]}',
+                                 data=json.dumps({'payment_date': None}),
+                                 headers=headers)
+
+                self.assertEqual(400, result.status_code)
+
+                self.clear_db()
+                get_item_from_db.cache_clear()
+
+    def test_patch_other_organization(self):
+        """
+        Test that PATCH requests to a resource's endpoint return status
+        code 403 if the changes move the records to a parent of another
+        organization.
+        """
+        with self.client() as c:
+            with self.app_context():
+                get_item_from_db.cache_clear()
+                _, _, post_items, _, endpoints, \
+                    user = get_sys_test_params(EMPLOYEE, 0, 'first')
+
+                headers = self.get_headers(user)
+                result = c.post(f'/{endpoints[0]}',
+                                data=json.dumps(post_items[0]),
+                                headers=headers)
+                _id = json.loads(result.data)['record']['id']
+                department_id = get_item_from_db(
+                    DEPARTMENT['model'],
+                    **solve_obj_dependencies(DEPARTMENT['post_objects'][2])
+                ).id
+                changes = {'department_id': department_id}
+
+                for url, body in [
+                    (f'/{endpoints[0]}/{_id}', changes),
+                    (f'/{endpoints[0]}', [{'id': _id, 'changes': changes}]),
+                    (f'/{endpoints[0]}', {
+                        'filter': {'department_id':
+                                   post_items[0]['department_id']},
+                        'changes': changes
+                    })
+                ]:
+                    with self.subTest(url=url, body=body):
+                        result = c.patch(url, data=json.dumps(body),
+                                         headers=headers)
+
+                        self.assertEqual(403, result.status_code)
+
+                record = json.loads(c.get(f'/{endpoints[0]}/{_id}',
+                                          headers=headers).data)['record']
+
+                self.assertEqual(post_items[0]['department_id'],
+                                 record['department_id'])
+
+                self.clear_db()
+                get_item_from_db.cache_clear()
+
     def test_put_not_found(self):
         """
         Test that PUT requests to a resource's endpoint return status
@@ -516,6 +1234,234 @@ class TestResources(BaseTest):
                             self.clear_db()
                             get_item_from_db.cache_clear()
 
+    def test_activate_inactivate_many(self):
+        """
+        Test that PUT requests without id to the activate endpoint change
+        every record of the list and cascade the inactivation of an
+        employee to its bank accounts.
+        """
+        with self.client() as c:
+            with self.app_context():
+                # Items cached by the previous tests were cleared from
+                # the db in tearDown.
+                get_item_from_db.cache_clear()
+
+                _, _, post_items, _, endpoints, \
+                    user = get_sys_test_params(BANK_ACCOUNT, 0, 'first')
+
+                item = post_items[0]
+                headers = self.get_headers(user)
+
+                result = c.post(f'/{endpoints[0]}',
+                                data=json.dumps(item),
+                                headers=headers)
+                account_id = json.loads(result.data)['record']['id']
+
+                employee = json.loads(c.get(
+                    f'/employee/{item["employee_id"]}',
+                    headers=headers).data)['record']
+
+                for body, updated, unchanged in [
+                    ({'is_active': False, 'ids': [employee['id']]},
+                     [employee['id']], []),
+                    ({'is_active': False, 'ids': [employee['id']]},
+                     [], [employee['id']]),
+                    ({'is_active': True,
+                      'department_id': employee['department_id']},
+                     [employee['id']], [])
+                ]:
+                    with self.subTest(body=body):
+                        result = c.put('/activate_employee',
+                                       data=json.dumps(body),
+                                       headers=headers)
+                        data = json.loads(result.data)
+
+                        self.assertEqual(200, result.status_code)
+                        self.assertEqual(updated, data['updated'])
+                        self.assertEqual(unchanged, data['unchanged'])
+
+                account = json.loads(c.get(f'/{endpoints[0]}/{account_id}',
+                                           headers=headers).data)['record']
+
+                self.assertFalse(account['is_active'])
+
+                for body, status in [
+                    ({'is_active': False, 'ids': [999]}, 404),
+                    ({'is_active': 'no', 'ids': [employee['id']]}, 400),
+                    ({'is_active': False}, 400)
+                ]:
+                    with self.subTest(body=body):
+                        result = c.put('/activate_employee',
+                                       data=json.dumps(body),
+                                       headers=headers)
+
+                        self.assertEqual(status, result.status_code)
+
+                self.clear_db()
+                get_item_from_db.cache_clear()
+
+    def test_inactivate_cascade(self):
+        """
+        Test that inactivating a single employee, with the activate
+        endpoint or PUT, also inactivates its bank accounts and that
+        is_active can not be changed with PATCH.
+        """
+        with self.client() as c:
+            with self.app_context():
+                get_item_from_db.cache_clear()
+                _, _, post_items, _, endpoints, \
+                    user = get_sys_test_params(BANK_ACCOUNT, 0, 'first')
+
+                item = post_items[0]
+                headers = self.get_headers(user)
+
+                result = c.post(f'/{endpoints[0]}',
+                                data=json.dumps(item),
+                                headers=headers)
+                account_id = json.loads(result.data)['record']['id']
+
+                for url, body, status in [
+                    (f'/activate_employee/{item["employee_id"]}',
+                     {'is_active': 'false'}, 200),
+                    (f'/employee/{item["employee_id"]}',
+                     {'is_active': True}, 400),
+                    ('/activate_employee',
+                     {'is_active': 'true', 'ids': [item['employee_id']]},
+                     200)
+                ]:
+                    with self.subTest(url=url, body=body):
+                        method = c.patch if url.startswith('/employee') \
+                            else c.put
+                        result = method(url, data=json.dumps(body),
+                                        headers=headers)
+
+                        self.assertEqual(status, result.status_code)
+
+                account = json.loads(c.get(f'/{endpoints[0]}/{account_id}',
+                                           headers=headers).data)['record']
+
+                self.assertFalse(account['is_active'])
+
+                c.put(f'/{endpoints[0]}/{account_id}',
+                      data=json.dumps(item), headers=headers)
+                employee = json.loads(
+                    c.get(f'/employee/{item["employee_id"]}',
+                          headers=headers).data)['record']
+                result = c.put(f'/employee/{item["employee_id"]}',
+                               data=json.dumps(dict(employee,
+                                                    is_active=False)),
+                               headers=headers)
+
+                self.assertEqual(200, result.status_code)
+                self.assertFalse(json.loads(result.data)['record']
+                                 ['is_active'])
+
+                account = json.loads(c.get(f'/{endpoints[0]}/{account_id}',
+                                           headers=headers).data)['record']
+
+                self.assertFalse(account['is_active'])
+
+                self.clear_db()
+                get_item_from_db.cache_clear()
+
+    def test_activate_user_token(self):
+        """
+        Test that the tokens of a user are rejected after the user or its
+        organization is inactivated.
+        """
+        with self.client() as c:
+            with self.app_context():
+                get_item_from_db.cache_clear()
+                _, _, post_items, _, endpoints, \
+                    user = get_sys_test_params(USER, 0, 'first')
+
+                headers = self.get_headers(user)
+                result = c.post(f'/{endpoints[0]}',
+                                data=json.dumps(post_items[0]),
+                                headers=headers)
+                url = f'/{endpoints[0]}/' \
+                    f'{json.loads(result.data)["record"]["id"]}'
+                user_headers = self.get_headers({
+                    'username': post_items[0]['username'],
+                    'password': post_items[0]['password']
+                })
+
+                result = c.get(url, headers=user_headers)
+
+                self.assertEqual(200, result.status_code)
+                self.assertNotIn('token_version',
+                                 json.loads(result.data)['record'])
+
+                # The tokens issued before the organization was inactivated
+                # are not accepted after it is activated again either.
+                _id = int(url.rsplit('/', 1)[1])
+                organization = OrganizationModel.query.get(
+                    post_items[0]['organization_id'])
+
+                for is_active in [False, True]:
+                    with self.subTest(is_active=is_active):
+                        organization.is_active = is_active
+                        organization.save_to_db()
+                        invalidate_token_version()
+
+                        self.assertEqual(
+                            is_active,
+                            AppUserModel.find_token_version(_id) is not None)
+                        self.assertEqual(401, c.get(url, headers=user_headers)
+                                         .status_code)
+
+                user_headers = self.get_headers({
+                    'username': post_items[0]['username'],
+                    'password': post_items[0]['password']
+                })
+
+                self.assertEqual(200, c.get(url, headers=user_headers)
+                                 .status_code)
+
+                c.put(f'/{endpoints[1]}/{url.rsplit("/", 1)[1]}',
+                      data=json.dumps({'is_active': False}),
+                      headers=headers)
+
+                self.assertEqual(401, c.get(url, headers=user_headers)
+                                 .status_code)
+
+                self.clear_db()
+                get_item_from_db.cache_clear()
+
+    def test_token_version_cache(self):
+        """
+        Test that the token version of a user is only read again after
+        the cached one is invalidated.
+        """
+        with self.client() as c:
+            with self.app_context():
+                user = get_sys_test_params(USER, 2)[5]
+                headers = self.get_headers(user)
+                _id = AppUserModel.find_by_username(user['username']).id
+                statements = []
+
+                def count(conn, cursor, statement, *args):
+                    if 'FROM app_user' in statement:
+                        statements.append(statement)
+
+                invalidate_token_version()
+                event.listen(db.engine, 'before_cursor_execute', count)
+
+                try:
+                    for invalidate, queries in [(False, 1), (False, 0),
+                                                (True, 1)]:
+                        with self.subTest(invalidate=invalidate):
+                            if invalidate:
+                                invalidate_token_version(_id)
+
+                            statements.clear()
+                            result = c.get('/countries', headers=headers)
+
+                            self.assertEqual(200, result.status_code)
+                            self.assertEqual(queries, len(statements))
+                finally:
+                    event.remove(db.engine, 'before_cursor_execute', count)
+
     def test_activate_without_authentication(self):
         """
         Test that a PUT requests to the resource's endpoint return
@@ -642,6 +1588,154 @@ class TestResources(BaseTest):
                             self.clear_db()
                             get_item_from_db.cache_clear()
 
+    def test_list_with_pagination(self):
+        """
+        Test that GET requests to the resource's endpoint with the limit
+        parameter return the list in pages linked by the next cursor.
+        """
+        with self.client() as c:
+            with self.app_context():
+                user = get_sys_test_params(OBJECTS_TO_TEST[0], 2)[5]
+                headers = self.get_headers(user)
+
+                result = c.get('/countries', headers=headers)
+                countries = json.loads(result.data)['list']
+
+                self.assertNotIn('Content-Length', result.headers)
+
+                result = c.get('/countries?limit=3', headers={
+                    **headers, 'Accept-Encoding': 'gzip'})
+
+                self.assertNotIn('Content-Encoding', result.headers)
+
+                for url in ['/countries', '/countries?limit=100']:
+                    with self.subTest(url=url):
+                        result = c.get(url, headers={
+                            **headers, 'Accept-Encoding': 'gzip'})
+
+                        self.assertEqual('gzip',
+                                         result.headers['Content-Encoding'])
+                        self.assertEqual(countries, json.loads(
+                            gzip.decompress(result.data))['list'])
+
+                # Each chunk of a streamed response is flushed, so it can be
+                # decompressed as soon as it is received.
+                result = c.get('/countries', buffered=False, headers={
+                    **headers, 'Accept-Encoding': 'gzip'})
+                decompressor = zlib.decompressobj(31)
+
+                self.assertTrue(decompressor.decompress(
+                    next(iter(result.response))).startswith(b'{"list": ['))
+
+                result.close()
+
+                # Streamed lists are written as the whole document would be.
+                for debug, indent in [(False, None), (True, 4)]:
+                    with self.subTest(debug=debug):
+                        current_app.debug = debug
+                        result = c.get('/countries', headers=headers)
+
+                        self.assertEqual(json.dumps({'list': countries},
+                                                    indent=indent) + '\n',
+                                         result.get_data(as_text=True))
+
+                current_app.debug = False
+
+                ids = []
+                cursor = None
+
+                while True:
+                    url = '/countries?limit=3'
+                    if cursor:
+                        url += f'&after={cursor}'
+
+                    result = c.get(url, headers=headers)
+                    page = json.loads(result.data)
+
+                    self.assertEqual(200, result.status_code)
+                    self.assertLessEqual(len(page['list']), 3)
+
+                    ids.extend(x['id'] for x in page['list'])
+                    cursor = page['next']
+
+                    if not cursor:
+                        break
+
+                self.assertEqual([x['id'] for x in countries], ids)
+
+                for url in ['/countries?limit=0', '/countries?limit=a',
+                            '/countries?limit=1&after=abc',
+                            '/countries?after=WzFd']:
+                    with self.subTest(url=url):
+                        result = c.get(url, headers=headers)
+
+                        self.assertEqual(400, result.status_code)
+
+                self.clear_db()
+                get_item_from_db.cache_clear()
+
+    def test_list_with_filters(self):
+        """
+        Test that GET requests to the resource's endpoint filter and sort
+        the list with the whitelisted columns.
+        """
+        with self.client() as c:
+            with self.app_context():
+                _, _, post_items, _, endpoints, \
+                    user = get_sys_test_params(PAYMENT, 2, 'all')
+
+                headers = self.get_headers(user)
+
+                for item in post_items:
+                    c.post(f'/{endpoints[0]}',
+                           data=json.dumps(item),
+                           headers=headers)
+
+                url = f'/{endpoints[2]}/{post_items[0]["employee_id"]}'
+
+                for query, dates in [
+                    ('sort=-payment_date', ['2018-01-15', '2018-01-01']),
+                    ('payment_date__gt=2018-01-01', ['2018-01-15']),
+                    ('payment_date=2018-01-01', ['2018-01-01']),
+                    ('payment_date__gte=2018-02-01', []),
+                    ('sort=-payment_date&limit=1', ['2018-01-15']),
+                    ('payment_date=2018-01-01&_=1546300800000',
+                     ['2018-01-01'])
+                ]:
+                    with self.subTest(query=query):
+                        result = c.get(f'{url}?{query}', headers=headers)
+
+                        self.assertEqual(200, result.status_code)
+                        self.assertEqual(dates, [
+                            x['payment_date']
+                            for x in json.loads(result.data)['list']
+                        ])
+
+                result = c.get(f'{url}?sort=-payment_date&limit=1',
+                               headers=headers)
+                cursor = json.loads(result.data)['next']
+
+                result = c.get(f'{url}?sort=-payment_date&limit=1'
+                               f'&after={cursor}',
+                               headers=headers)
+                page = json.loads(result.data)
+
+                self.assertEqual(['2018-01-01'],
+                                 [x['payment_date'] for x in page['list']])
+                self.assertIsNone(page['next'])
+
+                for query in ['document_number=1234-abc',
+                              'payment_date__ne=2018-01-01',
+                              'payment_date=2018-13-01',
+                              'sort=document_number']:
+                    with self.subTest(query=query):
+                        result = c.get(f'{url}?{query}', headers=headers)
+
+                        self.assertEqual(400, result.status_code)
+
+                self.clear_db()
+                get_item_from_db.cache_clear()
+
     def test_list_without_authentication(self):
         """
         Test that GET requests to the resource's endpoint return status
@@ -681,6 +1775,55 @@ class TestResources(BaseTest):
                             self.clear_db()
                             get_item_from_db.cache_clear()
 
+    def test_export(self):
+        """
+        Test that GET requests to the export endpoints return the records
+        of the organization as CSV or NDJSON.
+        """
+        with self.client() as c:
+            with self.app_context():
+                _, _, post_items, _, endpoints, \
+                    user = get_sys_test_params(PAYMENT, 2, 'all')
+
+                headers = self.get_headers(user)
+
+                for item in post_items:
+                    c.post(f'/{endpoints[0]}',
+                           data=json.dumps(item),
+                           headers=headers)
+
+                result = c.get('/export_payments', headers=headers)
+                rows = list(csv.reader(StringIO(result.data.decode())))
+
+                self.assertEqual(200, result.status_code)
+                self.assertEqual('text/csv', result.mimetype)
+                self.assertEqual(['id', 'payment_date', 'document_number',
+                                  'employee_id'], rows[0])
+                self.assertEqual(['2018-01-01', '2018-01-15'],
+                                 [row[1] for row in rows[1:]])
+
+                result = c.get('/export_payments?format=ndjson'
+                               '&payment_date__gt=2018-01-01',
+                               headers={**headers,
+                                        'Accept-Encoding': 'gzip'})
+                lines = gzip.decompress(result.data).decode().splitlines()
+
+                self.assertEqual(200, result.status_code)
+                self.assertEqual('gzip', result.headers['Content-Encoding'])
+                self.assertEqual(['2018-01-15'], [
+                    json.loads(line)['payment_date'] for line in lines
+                ])
+
+                for query in ['format=xml', 'document_number=1234-abc']:
+                    with self.subTest(query=query):
+                        result = c.get(f'/export_payments?{query}',
+                                       headers=headers)
+
+                        self.assertEqual(400, result.status_code)
+
+                self.clear_db()
+                get_item_from_db.cache_clear()
+
     def test_post_raw_attendance_with_authentication(self):
         """
         Test that a  POST request to the raw_attendance endpoint return
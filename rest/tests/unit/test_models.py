@@ -1,8 +1,12 @@
 from copy import deepcopy
+from datetime import date
+from decimal import Decimal
 from unittest import TestCase
 
 from werkzeug.security import check_password_hash
 
+from models.payment import PaymentModel
+from models.payment_detail import PaymentDetailModel
 from tests.business_objects import get_unit_test_params, OBJECTS_TO_TEST, \
     RAW_ATTENDANCE
 
@@ -31,3 +35,19 @@ class TestModels(TestCase):
                 inst = model(**item)
 
                 self.check_assertions(item, inst)
+
+    def test_to_dict(self):
+        """Test the serialization of a model and its collections."""
+        payment = PaymentModel(date(2018, 1, 1), '1234-abc', 1)
+        payment.payment_details.append(PaymentDetailModel(
+            'Salario Regular', Decimal('500.25'), None, None, None, 1))
+
+        result = payment.to_dict(expand=('deduction_details',))
+
+        self.assertEqual(result['payment_date'], '2018-01-01')
+        self.assertEqual(result['document_number'], '1234-abc')
+        self.assertEqual(result['deduction_details'], [])
+        self.assertEqual(result['payment_details'][0]['gross_payment'],
+                         '500.25')
+        self.assertIsNone(result['payment_details'][0]['ss_deduction'])
+        self.assertNotIn('payment_details', payment.to_dict(depth=0))